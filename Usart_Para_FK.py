@@ -3,17 +3,33 @@ import csv
 import struct
 import time
 import sys
-from typing import Dict, Tuple, List
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Tuple
 
-try:
-    import openpyxl
-except Exception:
-    openpyxl = None
+__all__ = [
+    'build_frame',
+    'build_read_request',
+    'parse_frame',
+    'read_group',
+    'write_group',
+    'load_mapping',
+    'format_group_csv',
+]
 
-try:
-    import serial
-except Exception:
-    serial = None
+def _import_openpyxl():
+    # 延迟导入：只有真正读取 params.xlsx 时才加载 openpyxl
+    try:
+        import openpyxl
+    except Exception:
+        openpyxl = None
+    return openpyxl
+
+def _import_serial():
+    try:
+        import serial
+    except Exception:
+        serial = None
+    return serial
 
 # 日志输出控制
 ENABLE_LOGGING = True
@@ -25,37 +41,139 @@ except (ImportError, ModuleNotFoundError):
     # 如果导入失败，使用默认值
     ENABLE_LOGGING = True
 
-def _crc16_modbus(data: bytes) -> int:
+def _crc16_table_entry(i: int) -> int:
+    crc = i
+    for _ in range(8):
+        if crc & 1:
+            crc = (crc >> 1) ^ 0xA001
+        else:
+            crc >>= 1
+    return crc
+
+# CRC16/MODBUS 查表（多项式 0xA001，导入时生成一次）
+CRC_TABLE = tuple(_crc16_table_entry(i) for i in range(256))
+# 双字节折叠表：CRC 寄存器恰为 16 位，低字节经两轮归约后的贡献可预先合并
+CRC_TABLE_2 = tuple((CRC_TABLE[i] >> 8) ^ CRC_TABLE[CRC_TABLE[i] & 0xFF] for i in range(256))
+_NATIVE_LE = sys.byteorder == 'little'
+
+def _crc16_modbus_py(data: bytes, _t=CRC_TABLE, _t2=CRC_TABLE_2) -> int:
     crc = 0xFFFF
+    n = len(data)
+    if _NATIVE_LE and n >= 16:
+        # 按小端 16 位字一次处理 2 字节，无分支
+        mv = memoryview(data)
+        even = n & ~1
+        for w in mv[:even].cast('H'):
+            v = crc ^ w
+            crc = _t2[v & 0xFF] ^ _t[v >> 8]
+        data = mv[even:]
     for b in data:
-        crc ^= b
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ 0xA001
-            else:
-                crc >>= 1
-    return crc & 0xFFFF
+        crc = (crc >> 8) ^ _t[(crc ^ b) & 0xFF]
+    return crc
+
+# 可选的 C 实现（fastcrc），导入后用标准校验值自检一次，不一致则不用；
+# 组帧传入 bytearray、分块和程序帧传入 memoryview，这两种类型也要能直接计算
+try:
+    from fastcrc import crc16 as _fastcrc16
+    for _probe in (b'123456789', bytearray(b'123456789'), memoryview(b'123456789')):
+        if _fastcrc16.modbus(_probe) != 0x4B37:
+            _fastcrc16 = None
+            break
+except Exception:
+    _fastcrc16 = None
+
+# 其次用 crcmod 的 C 扩展；crcmod 未编译扩展时是纯 Python 逐字节实现，比上面的查表还慢，不用
+_crcmod16 = None
+if _fastcrc16 is None:
+    try:
+        import crcmod.crcmod as _crcmod
+        if _crcmod._usingExtension:
+            _crcmod16 = _crcmod.mkCrcFun(0x18005, initCrc=0xFFFF, rev=True, xorOut=0)
+            # 程序帧按 memoryview 传入，自检时一并确认
+            if _crcmod16(memoryview(b'123456789')) != 0x4B37:
+                _crcmod16 = None
+    except Exception:
+        _crcmod16 = None
+
+if _fastcrc16 is not None:
+    _crc16_modbus = _fastcrc16.modbus
+elif _crcmod16 is not None:
+    _crc16_modbus = _crcmod16
+else:
+    _crc16_modbus = _crc16_modbus_py
+
+def _crc16_modbus_blocks(buf, block_size: int) -> List[int]:
+    """按 block_size 切分连续缓冲区，逐块计算 CRC16/MODBUS（末块可不足 block_size）"""
+    mv = memoryview(buf)
+    crc = _crc16_modbus
+    return [crc(mv[i:i + block_size]) for i in range(0, len(mv), block_size)]
 
 def _sum8(data: bytes) -> int:
     return sum(data) & 0xFF
 
+_PACK_LE_H = struct.Struct('<H').pack
+
+# 单帧最大长度，read_group 读到该长度仍无 ';' 则放弃
+_MAX_FRAME_LEN = 4096
+
+@lru_cache(maxsize=16)
+def _preamble_bytes(preamble: str) -> bytes:
+    return bytes.fromhex(preamble) if preamble else b''
+
+@lru_cache(maxsize=16)
+def _algo_upper(algo: str) -> str:
+    return algo.upper()
+
+@lru_cache(maxsize=8)
+def _algo_cs_len(algo: str) -> int:
+    """校验算法对应的帧尾校验字节数"""
+    algo = _algo_upper(algo)
+    if algo == 'CRC16_MODBUS':
+        return 2
+    if algo == 'SUM8':
+        return 1
+    return 0
+
+def _file_mtime(path: str):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _cfg_file_key(*paths: str) -> Tuple:
+    """以绝对路径 + 修改时间作为缓存键，文件被编辑后自动重新加载"""
+    key = []
+    for p in paths:
+        p = os.path.abspath(p)
+        key += [p, _file_mtime(p)]
+    return tuple(key)
+
 def _read_protocol_cfg() -> Dict[str, str]:
-    p = os.path.join('config', 'Protocol.csv')
-    if os.path.exists(p):
+    key = _cfg_file_key(os.path.join('config', 'Protocol.csv'), os.path.join('config', 'params.xlsx'))
+    return dict(_load_protocol_cfg(*key))
+
+@lru_cache(maxsize=8)
+def _load_protocol_cfg(p: str, p_mtime, x: str, x_mtime) -> Dict[str, str]:
+    if p_mtime is not None:
         with open(p, 'r', encoding='utf-8') as f:
             r = csv.DictReader(f)
             rows = list(r)
             if rows:
                 return rows[0]
-    if openpyxl:
-        x = os.path.join('config', 'params.xlsx')
-        if os.path.exists(x):
-            wb = openpyxl.load_workbook(x, data_only=True)
-            if 'Protocol' in wb.sheetnames:
-                ws = wb['Protocol']
-                headers = [c.value for c in next(ws.iter_rows(min_row=1, max_row=1))]
-                vals = [c.value for c in next(ws.iter_rows(min_row=2, max_row=2))]
-                return {str(k): str(v) for k, v in zip(headers, vals)}
+    if x_mtime is not None:
+        openpyxl = _import_openpyxl()
+        if openpyxl:
+            # 只读模式流式解析，只取 Protocol 表的前两行
+            wb = openpyxl.load_workbook(x, data_only=True, read_only=True)
+            try:
+                if 'Protocol' in wb.sheetnames:
+                    ws = wb['Protocol']
+                    it = ws.iter_rows(min_row=1, max_row=2, values_only=True)
+                    headers = next(it)
+                    vals = next(it)
+                    return {str(k): str(v) for k, v in zip(headers, vals)}
+            finally:
+                wb.close()
     return {
         'Preamble': 'FC',
         'Checksum': 'CRC16_MODBUS',
@@ -68,85 +186,80 @@ def _read_protocol_cfg() -> Dict[str, str]:
         'TxDecimals': '0',
     }
 
+def _group_mapping_key(group: str) -> Tuple:
+    return (group,) + _cfg_file_key(os.path.join('config', f'{group}组.csv'), os.path.join('config', 'params.xlsx'))
+
 def _read_group_mapping(group: str) -> List[Dict[str, str]]:
-    csv_path = os.path.join('config', f'{group}组.csv')
+    return [dict(r) for r in _load_group_mapping(*_group_mapping_key(group))]
+
+def _group_precision_map(group: str) -> Dict[str, int]:
+    return _load_precision_map(*_group_mapping_key(group))
+
+def _group_bounds(group: str) -> Dict[str, tuple]:
+    return _load_bounds_map(*_group_mapping_key(group))
+
+# 规范化后的表头 -> 标准列名
+_MAPPING_COLS = {
+    'key': 'Key',
+    'name': 'Name',
+    'unit': 'Unit',
+    'min': 'Min',
+    'max': 'Max',
+    'precision': 'Precision',
+    'default': 'Default',
+    'description': 'Description',
+}
+
+@lru_cache(maxsize=32)
+def _load_group_mapping(group: str, csv_path: str, csv_mtime, x: str, x_mtime) -> Tuple[Dict[str, str], ...]:
     rows = []
-    if os.path.exists(csv_path):
+    if csv_mtime is not None:
         with open(csv_path, 'r', encoding='utf-8-sig') as f:
             r = csv.DictReader(f)
+            # 表头只规范化一次，得到 (原始列名, 标准列名) 列表，逐行时直接取值
+            cols = []
+            for k in r.fieldnames or []:
+                kk = ('' if k is None else str(k)).strip().lstrip('\ufeff').lower().replace('_','').replace(' ','')
+                if kk in _MAPPING_COLS:
+                    cols.append((k, _MAPPING_COLS[kk]))
             for row in r:
                 norm = {}
-                for k, v in row.items():
-                    kk = ('' if k is None else str(k)).strip().lstrip('\ufeff').lower().replace('_','').replace(' ','')
+                for k, c in cols:
+                    v = row.get(k)
                     vv = '' if v is None else str(v).strip()
                     if vv.lower() in ('null','none','nan'):
                         vv = ''
-                    if kk == 'key':
-                        norm['Key'] = vv
-                    elif kk == 'name':
-                        norm['Name'] = vv
-                    elif kk == 'unit':
-                        norm['Unit'] = vv
-                    elif kk == 'min':
-                        norm['Min'] = vv
-                    elif kk == 'max':
-                        norm['Max'] = vv
-                    elif kk == 'precision':
-                        norm['Precision'] = vv
-                    elif kk == 'default':
-                        norm['Default'] = vv
-                    elif kk == 'description':
-                        norm['Description'] = vv
-                if any(norm.get(x,'') for x in ('Key','Name','Unit','Min','Max','Precision','Default','Description')):
+                    norm[c] = vv
+                if any(norm.get(c,'') for c in ('Key','Name','Unit','Min','Max','Precision','Default','Description')):
                     rows.append(norm)
-            return rows
-    if openpyxl:
-        x = os.path.join('config', 'params.xlsx')
-        if os.path.exists(x):
-            wb = openpyxl.load_workbook(x, data_only=True)
-            sheet_name = f'{group}组'
-            if sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                header_cells = next(ws.iter_rows(min_row=1, max_row=1))
-                headers = [str(c.value) for c in header_cells]
-                for rr in ws.iter_rows(min_row=2):
-                    vals = [c.value for c in rr]
-                    if all(v is None for v in vals):
-                        continue
-                    rows.append({headers[i]: '' if vals[i] is None else str(vals[i]) for i in range(len(headers))})
-                return rows
-    return []
-
-def _fmt_value(v: float, precision: int) -> str:
-    return f'{v:.{precision}f}'
-
-def _payload_from_values(group: str, values: Dict[str, float], precision_map: Dict[str, int], start_char: str, decimals_override: str) -> str:
-    parts = []
-    for k in sorted(values.keys(), key=lambda x: int(x[1:])):
-        if decimals_override != '':
+            return tuple(rows)
+    if x_mtime is not None:
+        openpyxl = _import_openpyxl()
+        if openpyxl:
+            wb = openpyxl.load_workbook(x, data_only=True, read_only=True)
             try:
-                p = int(decimals_override)
-            except Exception:
-                p = precision_map.get(k, 2)
-        else:
-            p = precision_map.get(k, 2)
-        parts.append(f'{k}:{_fmt_value(values[k], p)}')
-    return start_char + 'WRITE' + ','.join(parts) + ';'
+                sheet_name = f'{group}组'
+                if sheet_name in wb.sheetnames:
+                    ws = wb[sheet_name]
+                    it = ws.iter_rows(min_row=1, values_only=True)
+                    headers = [str(v) for v in next(it)]
+                    n = len(headers)
+                    for vals in it:
+                        if all(v is None for v in vals):
+                            continue
+                        # 只读模式下行尾的空单元格可能被省略，补齐到表头长度
+                        if len(vals) < n:
+                            vals = vals + (None,) * (n - len(vals))
+                        rows.append({headers[i]: '' if vals[i] is None else str(vals[i]) for i in range(n)})
+                    return tuple(rows)
+            finally:
+                wb.close()
+    return ()
 
-def _checksum_bytes(payload: bytes, algo: str) -> bytes:
-    if algo.upper() == 'CRC16_MODBUS':
-        crc = _crc16_modbus(payload)
-        return struct.pack('<H', crc)
-    if algo.upper() == 'SUM8':
-        s = _sum8(payload)
-        return bytes([s])
-    return b''
-
-def build_frame(group: str, values: Dict[str, float], cfg: Dict[str, str] | None = None) -> bytes:
-    cfg = cfg or _read_protocol_cfg()
-    rows = _read_group_mapping(group)
+@lru_cache(maxsize=32)
+def _load_precision_map(*key) -> Dict[str, int]:
     precision_map = {}
-    for r in rows:
+    for r in _load_group_mapping(*key):
         k = r.get('Key', '')
         p = r.get('Precision', '2')
         if k:
@@ -154,62 +267,163 @@ def build_frame(group: str, values: Dict[str, float], cfg: Dict[str, str] | None
                 precision_map[k] = int(p)
             except Exception:
                 precision_map[k] = 2
-    tx_start = (cfg.get('TxStart','!') or '!')[0]
-    tx_dec = str(cfg.get('TxDecimals',''))
-    payload = _payload_from_values(group, values, precision_map, tx_start, tx_dec).encode('ascii')
-    cs_algo = cfg.get('Checksum', 'CRC16_MODBUS')
-    preamble = cfg.get('Preamble', 'FC')
-    pre_bytes = bytes.fromhex(preamble) if preamble else b''
-    cs = _checksum_bytes(payload, cs_algo)
-    return pre_bytes + payload + cs
+    return precision_map
+
+@lru_cache(maxsize=32)
+def _load_bounds_map(*key) -> Dict[str, tuple]:
+    """键 -> ((min, max), ...)，每行一项；Min/Max 无法解析时该项为 None"""
+    bounds: Dict[str, list] = {}
+    for r in _load_group_mapping(*key):
+        k = r.get('Key', '')
+        if not k:
+            continue
+        try:
+            mn = float(r.get('Min', '')) if r.get('Min', '') != '' else None
+            mx = float(r.get('Max', '')) if r.get('Max', '') != '' else None
+            b = (mn, mx)
+        except Exception:
+            b = None
+        bounds.setdefault(k, []).append(b)
+    return {k: tuple(v) for k, v in bounds.items()}
+
+# 常用精度的格式化函数，避免每次调用都拼接嵌套 f-string
+_FMT = [f'{{:.{p}f}}'.format for p in range(13)]
+
+def _formatter(precision: int):
+    if 0 <= precision < len(_FMT):
+        return _FMT[precision]
+    return f'{{:.{precision}f}}'.format
+
+def _group_formatters(group: str) -> Tuple[Tuple[str, ...], tuple, frozenset]:
+    return _load_group_formatters(*_group_mapping_key(group))
+
+@lru_cache(maxsize=32)
+def _load_group_formatters(*key) -> Tuple[Tuple[str, ...], tuple, frozenset]:
+    """预先按数字后缀排好键顺序，并取得每个键的格式化函数"""
+    precision_map = _load_precision_map(*key)
+    try:
+        ordered = tuple(sorted(precision_map, key=lambda x: int(x[1:])))
+    except ValueError:
+        ordered = ()
+    fmts = tuple(_formatter(precision_map[k]) for k in ordered)
+    return ordered, fmts, frozenset(ordered)
+
+def _payload_from_values(group: str, values: Dict[str, float], precision_map: Dict[str, int], start_char: str, decimals_override: str) -> bytes:
+    override = None
+    if decimals_override != '':
+        try:
+            override = _formatter(int(decimals_override))
+        except Exception:
+            override = None
+    ordered, fmts, key_set = _group_formatters(group)
+    if values.keys() == key_set:
+        # 常见情况：写入整组参数，直接使用预排序的键和格式化函数
+        keys = ordered
+    else:
+        keys = sorted(values.keys(), key=lambda x: int(x[1:]))
+        fmts = [_formatter(precision_map.get(k, 2)) for k in keys]
+    if override is not None:
+        parts = [f'{k}:{override(values[k])}' for k in keys]
+    else:
+        parts = [f'{k}:{fmts[i](values[k])}' for i, k in enumerate(keys)]
+    out = bytearray(start_char.encode('ascii'))
+    out += b'WRITE'
+    out += ','.join(parts).encode('ascii')
+    out += b';'
+    return out
+
+def _checksum_bytes(payload: bytes, algo: str) -> bytes:
+    algo = _algo_upper(algo)
+    if algo == 'CRC16_MODBUS':
+        return _PACK_LE_H(_crc16_modbus(payload))
+    if algo == 'SUM8':
+        s = _sum8(payload)
+        return bytes([s])
+    return b''
+
+def _cs_crc16(payload: bytes) -> bytes:
+    return _PACK_LE_H(_crc16_modbus(payload))
+
+def _cs_sum8(payload: bytes) -> bytes:
+    return bytes((_sum8(payload),))
+
+def _cs_none(payload: bytes) -> bytes:
+    return b''
+
+class _CfgView(NamedTuple):
+    """协议配置中收发帧需要的字段，预先解析好"""
+    pre_bytes: bytes
+    algo: str
+    cs_len: int
+    cs_fn: Callable[[bytes], bytes]
+    tx_start: str
+    rx_start: str
+    tx_dec: str
+
+def _compile_cfg_items(items: tuple) -> _CfgView:
+    cfg = dict(items)
+    algo = _algo_upper(cfg.get('Checksum', 'CRC16_MODBUS'))
+    cs_len = _algo_cs_len(algo)
+    cs_fn = _cs_crc16 if cs_len == 2 else (_cs_sum8 if cs_len == 1 else _cs_none)
+    return _CfgView(
+        pre_bytes=_preamble_bytes(cfg.get('Preamble', 'FC')),
+        algo=algo,
+        cs_len=cs_len,
+        cs_fn=cs_fn,
+        tx_start=(cfg.get('TxStart','!') or '!')[0],
+        rx_start=(cfg.get('RxStart','#') or '#')[0],
+        tx_dec=str(cfg.get('TxDecimals','')),
+    )
+
+_compile_cfg = lru_cache(maxsize=16)(_compile_cfg_items)
+
+def _cfg_view(cfg: Dict[str, str]) -> _CfgView:
+    # csv.DictReader 行尾多余的逗号会产生键为 None 的列，按 str(键) 排序避免与 str 比较出错
+    items = tuple(sorted(cfg.items(), key=lambda kv: str(kv[0])))
+    try:
+        return _compile_cfg(items)
+    except TypeError:
+        # 配置中含不可哈希的值时不缓存
+        return _compile_cfg_items(items)
+
+def build_frame(group: str, values: Dict[str, float], cfg: Dict[str, str] | None = None) -> bytes:
+    v = _cfg_view(cfg or _read_protocol_cfg())
+    payload = _payload_from_values(group, values, _group_precision_map(group), v.tx_start, v.tx_dec)
+    return b''.join((v.pre_bytes, payload, v.cs_fn(payload)))
 
 def build_read_request(group: str, cfg: Dict[str, str] | None = None) -> bytes:
-    cfg = cfg or _read_protocol_cfg()
-    tx_start = (cfg.get('TxStart','!') or '!')[0]
-    payload = f'{tx_start}READ:{group};'.encode('ascii')
-    cs_algo = cfg.get('Checksum', 'CRC16_MODBUS')
-    preamble = cfg.get('Preamble', 'FC')
-    pre_bytes = bytes.fromhex(preamble) if preamble else b''
-    cs = _checksum_bytes(payload, cs_algo)
-    return pre_bytes + payload + cs
+    v = _cfg_view(cfg or _read_protocol_cfg())
+    payload = b'%sREAD:%s;' % (v.tx_start.encode('ascii'), group.encode('ascii'))
+    return b''.join((v.pre_bytes, payload, v.cs_fn(payload)))
 
 def _parse_payload(payload: bytes) -> Dict[str, float]:
-    s = payload.decode('ascii')
-    if not (s.startswith('#') and s.endswith(';')):
+    # 直接在 bytes 上切分，只对键做 ASCII 解码；float() 可直接解析 bytes
+    if not (payload.startswith(b'#') and payload.endswith(b';')):
         return {}
-    s = s[1:-1]
     out: Dict[str, float] = {}
-    for part in s.split(','):
-        if ':' not in part:
+    for part in payload[1:-1].split(b','):
+        k, sep, v = part.partition(b':')
+        if not sep:
             continue
-        k, v = part.split(':', 1)
         try:
-            out[k] = float(v)
+            out[k.decode('ascii')] = float(v)
         except Exception:
             pass
     return out
 
 def parse_frame(frame: bytes, cfg: Dict[str, str] | None = None) -> Dict[str, float]:
-    cfg = cfg or _read_protocol_cfg()
-    preamble = cfg.get('Preamble', 'FC')
-    pre_len = len(bytes.fromhex(preamble)) if preamble else 0
-    algo = cfg.get('Checksum', 'CRC16_MODBUS').upper()
-    if algo == 'CRC16_MODBUS':
-        cs_len = 2
-    elif algo == 'SUM8':
-        cs_len = 1
-    else:
-        cs_len = 0
+    v = _cfg_view(cfg or _read_protocol_cfg())
+    pre_len = len(v.pre_bytes)
+    cs_len = v.cs_len
     if len(frame) < pre_len + 1 + cs_len:
         return {}
     payload = frame[pre_len:len(frame)-cs_len] if cs_len else frame[pre_len:]
-    cs_recv = frame[len(frame)-cs_len:] if cs_len else b''
-    cs_calc = _checksum_bytes(payload, algo)
-    if cs_len and cs_recv != cs_calc:
+    if cs_len and frame[len(frame)-cs_len:] != v.cs_fn(payload):
         return {}
     return _parse_payload(payload)
 
 def _open_port(cfg: Dict[str, str], port: str):
+    serial = _import_serial()
     if serial is None:
         raise RuntimeError('pyserial 未安装')
     baud = int(cfg.get('Baud', '115200'))
@@ -225,6 +439,33 @@ def _open_port(cfg: Dict[str, str], port: str):
     ser = serial.Serial(port=port, baudrate=baud, bytesize=serial.EIGHTBITS, parity=par, stopbits=serial.STOPBITS_TWO if stop == 2 else serial.STOPBITS_ONE, timeout=timeout_ms/1000.0)
     return ser
 
+# Linux serial_struct：flags 位于第5个 int（type, line, port, irq 之后）
+_TIOCGSERIAL = 0x541E
+_TIOCSSERIAL = 0x541F
+_ASYNC_LOW_LATENCY = 0x2000
+_SERIAL_FLAGS_OFFSET = 16
+
+def _enable_low_latency(ser) -> bool:
+    """在 Linux 上为 USB 串口开启 ASYNC_LOW_LATENCY，减少驱动端的接收合并等待
+
+    FTDI 等桥接芯片默认约 16ms 才上报一次收到的数据；逐块应答的烧录流程每块都要等这一轮。
+    非 Linux 平台或驱动不支持时直接返回 False，不影响正常使用。
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        import fcntl
+        fd = ser.fileno()
+        buf = bytearray(fcntl.ioctl(fd, _TIOCGSERIAL, bytes(128)))
+        flags = struct.unpack_from('i', buf, _SERIAL_FLAGS_OFFSET)[0]
+        if flags & _ASYNC_LOW_LATENCY:
+            return True
+        struct.pack_into('i', buf, _SERIAL_FLAGS_OFFSET, flags | _ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, _TIOCSSERIAL, bytes(buf))
+        return True
+    except Exception:
+        return False
+
 def read_group(port: str, group: str, cfg: Dict[str, str] | None = None) -> Dict[str, float]:
     cfg = cfg or _read_protocol_cfg()
     req = build_read_request(group, cfg)
@@ -232,40 +473,60 @@ def read_group(port: str, group: str, cfg: Dict[str, str] | None = None) -> Dict
     try:
         ser.reset_input_buffer()
         ser.write(req)
-        end_time = time.time() + int(cfg.get('Timeout', '1000'))/1000.0
+        timeout_s = int(cfg.get('Timeout', '1000'))/1000.0
+        deadline = time.monotonic() + timeout_s
+        # 按块读取到 ';'（pyserial 的 read_until 内部仍是逐字节 read(1)）
         buf = bytearray()
-        while time.time() < end_time:
-            b = ser.read(1)
-            if not b:
-                continue
-            buf += b
-            if b == b';':
-                algo = cfg.get('Checksum', 'CRC16_MODBUS').upper()
-                cs_len = 2 if algo == 'CRC16_MODBUS' else (1 if algo == 'SUM8' else 0)
-                more = ser.read(cs_len)
-                buf += more
-                return parse_frame(bytes(buf), cfg)
-        return {}
+        end = -1
+        while end == -1:
+            n = ser.in_waiting
+            if not n:
+                # 缓冲区为空时才阻塞等待，超时取剩余时间
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return {}
+                ser.timeout = remaining
+                n = 1
+            chunk = ser.read(n)
+            if not chunk:
+                return {}
+            start = len(buf)
+            buf += chunk
+            end = buf.find(b';', start)
+            if end == -1 and len(buf) >= _MAX_FRAME_LEN:
+                return {}
+        end += 1
+        if end > _MAX_FRAME_LEN:
+            return {}
+        # 校验尾：先用已读入的多余字节，不足部分再读
+        cs_len = _cfg_view(cfg).cs_len
+        need = cs_len - (len(buf) - end)
+        if need > 0:
+            # 超时取剩余时间；已到期时 timeout=0 只取走缓冲区中已有的字节
+            ser.timeout = max(deadline - time.monotonic(), 0.0)
+            buf += ser.read(need)
+        return parse_frame(bytes(buf[:end + cs_len]), cfg)
     finally:
         ser.close()
 
 def write_group(port: str, group: str, values: Dict[str, float], cfg: Dict[str, str] | None = None) -> bool:
     cfg = cfg or _read_protocol_cfg()
-    rows = _read_group_mapping(group)
-    for r in rows:
-        k = r.get('Key', '')
-        if not k:
+    bounds = _group_bounds(group)
+    for k, v in values.items():
+        row_bounds = bounds.get(k)
+        if not row_bounds:
             continue
-        if k in values:
-            try:
-                mn = float(r.get('Min', '')) if r.get('Min', '') != '' else None
-                mx = float(r.get('Max', '')) if r.get('Max', '') != '' else None
-                v = float(values[k])
-                if mn is not None and v < mn:
-                    return False
-                if mx is not None and v > mx:
-                    return False
-            except Exception:
+        try:
+            v = float(v)
+        except Exception:
+            return False
+        for b in row_bounds:
+            if b is None:
+                return False
+            mn, mx = b
+            if mn is not None and v < mn:
+                return False
+            if mx is not None and v > mx:
                 return False
     frame = build_frame(group, values, cfg)
     ser = _open_port(cfg, port)
@@ -6,7 +6,7 @@ Debug tool: Compare ENDCRC calculation between host and device
 
 import sys
 from hex_parser import HexParser
-from Usart_Para_FK import _crc16_modbus
+from Usart_Para_FK import _crc16_modbus_blocks
 
 def debug_crc_calculation(hex_file_path, block_size=2048):
     """
@@ -27,7 +27,7 @@ def debug_crc_calculation(hex_file_path, block_size=2048):
         print(f"Failed to parse HEX file: {e}")
         return
     
-    if not parser.data_map:
+    if not parser.segments:
         print("HEX file data is empty")
         return
     
@@ -38,42 +38,27 @@ def debug_crc_calculation(hex_file_path, block_size=2048):
     print(f"Total size: {end_addr - start_addr + 1} bytes")
     print()
     
-    # Split into blocks and calculate CRC
-    current_addr = start_addr
-    block_index = 0
+    # Build the whole image once (gaps and the last block padded with 0xFF)
+    nblocks = (end_addr - start_addr) // block_size + 1
+    image = parser.get_image(0xFF)
+    image += b'\xFF' * (nblocks * block_size - len(image))
+
+    # Calculate CRC for every block in one pass
+    crc_list = _crc16_modbus_blocks(image, block_size)
     total_crc = 0
-    crc_list = []
-    
+
     print(f"{'Block':<6} {'Address':<12} {'Length':<10} {'CRC16':<10} {'Total CRC':<12}")
     print("-" * 60)
-    
-    while current_addr <= end_addr:
-        # Extract one block of data
-        block_data = bytearray()
-        for offset in range(block_size):
-            addr = current_addr + offset
-            if addr in parser.data_map:
-                block_data.append(parser.data_map[addr])
-            else:
-                block_data.append(0xFF)
-        
-        # Calculate CRC for this block
-        block_crc = _crc16_modbus(bytes(block_data))
+
+    for block_index, block_crc in enumerate(crc_list):
         total_crc += block_crc
-        crc_list.append(block_crc)
-        
+        current_addr = start_addr + block_index * block_size
+
         # Display info
-        print(f"{block_index:<6} 0x{current_addr:08X}  {len(block_data):<10} "
+        print(f"{block_index:<6} 0x{current_addr:08X}  {block_size:<10} "
               f"0x{block_crc:04X}    0x{total_crc & 0xFFFF:04X}")
-        
-        # Next block
-        current_addr += block_size
-        block_index += 1
-        
-        # Check if all data has been processed
-        if current_addr > end_addr:
-            break
-    
+    block_index = len(crc_list)
+
     # Final result
     end_crc = total_crc & 0xFFFF
     print("-" * 60)
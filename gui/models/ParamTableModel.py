@@ -2,12 +2,15 @@ from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 import Usart_Para_FK as proto
 
 COLS = ['Key','Name','Unit','Min','Max','Precision','Value','Description']
+VALUE_COL = COLS.index('Value')
 
 class ParamTableModel(QAbstractTableModel):
     def __init__(self, group: str):
         super().__init__()
         self.group = group
         self.rows = []
+        self._key_to_rows = {}
+        self._fmt = []
         self.reload(group)
 
     def reload(self, group: str):
@@ -32,6 +35,17 @@ class ParamTableModel(QAbstractTableModel):
                 'Description': clean(r.get('Description','')),
             }
             self.rows.append(row)
+        # 预先生成 键->行号 映射和每行的格式串，供 updateValues 使用
+        self._key_to_rows = {}
+        self._fmt = []
+        for i, row in enumerate(self.rows):
+            if row['Key']:
+                self._key_to_rows.setdefault(row['Key'], []).append(i)
+            try:
+                prec = int(row['Precision'])
+            except Exception:
+                prec = 2
+            self._fmt.append(proto._formatter(prec))
         self.endResetModel()
 
     def rowCount(self, parent=QModelIndex()):
@@ -74,7 +88,7 @@ class ParamTableModel(QAbstractTableModel):
                 if mx is not None and v > mx:
                     return False
                 prec = int(row['Precision']) if row['Precision']!='' else 2
-                row['Value'] = f'{v:.{prec}f}'
+                row['Value'] = proto._formatter(prec)(v)
                 self.dataChanged.emit(index, index, [Qt.DisplayRole])
                 return True
             except Exception:
@@ -93,16 +107,22 @@ class ParamTableModel(QAbstractTableModel):
         return out
 
     def updateValues(self, data: dict):
-        for i, r in enumerate(self.rows):
-            k = r.get('Key','')
-            if k in data:
-                v = data[k]
-                try:
-                    prec = int(r.get('Precision','2'))
-                except Exception:
-                    prec = 2
-                r['Value'] = f'{v:.{prec}f}'
-        self.dataChanged.emit(self.index(0,0), self.index(self.rowCount()-1, self.columnCount()-1), [Qt.DisplayRole])
+        changed = []
+        for k, v in data.items():
+            for i in self._key_to_rows.get(k, ()):
+                self.rows[i]['Value'] = self._fmt[i](v)
+                changed.append(i)
+        if not changed:
+            return
+        # 只刷新 Value 列中实际变化的连续行段
+        changed.sort()
+        start = prev = changed[0]
+        for i in changed[1:]:
+            if i > prev + 1:
+                self.dataChanged.emit(self.index(start, VALUE_COL), self.index(prev, VALUE_COL), [Qt.DisplayRole])
+                start = i
+            prev = i
+        self.dataChanged.emit(self.index(start, VALUE_COL), self.index(prev, VALUE_COL), [Qt.DisplayRole])
 
     def setAllValuesError(self):
         for r in self.rows:
@@ -3,11 +3,29 @@
 Configuration Manager
 Save and load user configurations, including baud rate list, default baud rate, last used baud rate, etc.
 """
+import copy
 import json
 import os
 import sys
+import threading
 from typing import List, Optional
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize config to UTF-8 JSON (orjson when available, stdlib otherwise)
+
+    Both paths use 2-space indent (the only indent orjson supports), so the
+    file format does not depend on whether orjson is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 # ־
 ENABLE_LOGGING = True
 try:
@@ -31,10 +49,19 @@ class ConfigManager:
         "last_hex_path": "",
         "custom_baud_rates": []
     }
+
+    # Delay (seconds) used to coalesce consecutive saves into one write
+    SAVE_DELAY = 0.25
     
     def __init__(self, config_path: str = "config/user_config.json"):
         self.config_path = config_path
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self._config_dir = os.path.dirname(self.config_path)
+        self._dir_ready = False
+        # Snapshot of the config waiting to be written; None when nothing is pending
+        self._pending: Optional[dict] = None
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
         self.load()
     
     def load(self):
@@ -49,19 +76,48 @@ class ConfigManager:
             except Exception as e:
                 if ENABLE_LOGGING:
                     print(f"Failed to load config: {e}")
-                self.config = self.DEFAULT_CONFIG.copy()
+                self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         else:
-            self.save()
+            with self._lock:
+                self._pending = copy.deepcopy(self.config)
+            self.flush()
     
     def save(self):
-        """Save configuration file"""
-        try:
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            if ENABLE_LOGGING:
-                print(f"Failed to save config: {e}")
+        """Schedule a save; several calls within SAVE_DELAY result in one write
+
+        The config is snapshotted here, on the caller's thread, so the timer
+        thread never serializes a dict that is being modified.
+        """
+        with self._lock:
+            self._pending = copy.deepcopy(self.config)
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write pending changes to disk now (atomic replace)"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._pending is None:
+                return
+            tmp_path = self.config_path + '.tmp'
+            try:
+                if not self._dir_ready:
+                    if self._config_dir:
+                        os.makedirs(self._config_dir, exist_ok=True)
+                    self._dir_ready = True
+                data = _dumps(self._pending)
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.config_path)
+                self._pending = None
+            except Exception as e:
+                if ENABLE_LOGGING:
+                    print(f"Failed to save config: {e}")
     
     def get_baud_rates(self) -> List[int]:
         """Get all baud rates (including custom)"""
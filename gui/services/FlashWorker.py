@@ -2,10 +2,11 @@
 固件烧录Worker
 实现HEX文件烧录到下位机的完整状态机
 """
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QObject, Signal, Slot, QTimer
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 import time
+import struct
 import sys
 import os
 import Usart_Para_FK as proto
@@ -35,6 +36,10 @@ class FlashState(Enum):
     FAILED = 10        # 烧录失败
 
 
+# 2字节小端CRC转整数
+_U16LE = struct.Struct('<H').unpack_from
+
+
 class FlashWorker(QObject):
     """固件烧录Worker"""
 
@@ -47,29 +52,64 @@ class FlashWorker(QObject):
     sigErrorDetail = Signal(str, str, str)  # 错误类型, 期望值, 实际值
     sigVerifyOk = Signal(str, str)  # 期望值, 实际值
 
+    # 编程阶段日志攒够多少行合并为一次 sigLog 发出
+    LOG_BATCH_LINES = 16
+    LOG_FLUSH_MS = 50  # 缓存日志最长滞留时间(ms)
+    # 连续出错时的错误日志限流：距上次输出超过该秒数，或每累计N条时才输出
+    ERR_LOG_INTERVAL = 0.2
+    ERR_LOG_EVERY = 10
+
     def __init__(self):
         super().__init__()
         self.state = FlashState.IDLE
         self.ser = None
         self.hex_parser = None
         self.data_blocks = []
+        self._total_bytes = 0  # 固件总字节数
+        self._erase_blocks = 0  # 需擦除的2048字节块数
         self.current_block_index = 0
         self.retry_count = 0
         self.max_retries = 20  # 最大重试20次，避免卡顿
         self.last_sent_crc = None
         self.total_data_crc = 0  # 累计数据CRC
         self.cfg = None
+        # 以下协议常量在 start_flash 时从配置计算一次，避免每帧查询 cfg
+        self._cs_algo = 'CRC16_MODBUS'  # 校验算法
+        self._cs_fn = proto._cs_crc16  # 校验计算函数（按算法预先选定）
+        self._cs_len = 2  # 帧校验长度
+        self._pre_bytes = b''  # 帧前导
+        self._pre_len = 0
+        self._tx_start = '!'  # 发送起始符
+        self._rx_start = '#'  # 接收起始符
+        # 期望的回应内容（str 用于日志/信号，bytes 用于比较）
+        self._exp_init = self._exp_erase = self._exp_reply_prefix = ''
+        self._exp_init_b = self._exp_erase_b = self._exp_reply_prefix_b = b''
+        # 固定的命令帧/帧头（start_flash 时编码一次）
+        self._init_frame = self._erase_frame = b''
+        self._program_hdr_prefix = self._verify_hdr = b''
+        self._block_frames = []  # 每个数据块的完整发送帧（start_flash 时一次构建，重试直接复用）
+        self._block_crcs = []  # 每个数据块帧的帧CRC
+        self._block_replies = []  # 每个数据块期望的回应 (完整帧, payload)
+        self._exp_init_rx = self._exp_erase_rx = None  # 期望的初始化/擦除回应 (完整帧, payload)
+        self._verify_ascii_ok = {}  # 校验回应中可直接接受的ASCII总CRC -> 对应字节
+        # 编程滑动窗口：允许在当前块未确认时提前发出后续块（默认1，即逐块应答）
+        self.window_size = 1
+        self._ahead = {}  # 已提前发出、尚未确认的后续块: 块序号 -> 帧CRC（按序号连续）
+        self._acked_ahead = set()  # 先于当前块收到确认的后续块序号
         self.consecutive_errors = 0  # 连续错误计数
         self.max_consecutive_errors = 15  # 最大连续错误数
         self.verify_retries = 0  # VERIFY阶段单独计数
         self.max_verify_retries = 30  # VERIFY阶段允许更多重试
         self.debug_mode = False  # 调试模式：手动推进、提示期望响应
         self.crc_accumulate_count = 0  # CRC累加次数计数器
-        self.accumulated_crc_list = []  # 存储每块参与累加的CRC值
+        self._crc_strs = []  # 当前行待输出的帧CRC文本（满8个合并为一行）
+        self._crc_lines = []  # 已格式化好的帧CRC列表行
         self.err_crc = 0  # 错误CRC计数
         self.err_format = 0  # 格式错误计数
         self.err_data = 0  # 数据错误计数
         self.err_total = 0  # 总错误计数
+        self._last_err_log_ts = 0.0  # 上次输出错误日志的时间(monotonic)
+        self._err_suppressed = 0  # 限流期间未输出的错误条数
         self.flash_start_ts = None  # 烧录开始时间戳
         self.init_retry_delay = 50  # 初始化重试延迟(ms)，默认50ms
         self.init_start_time = None  # 初始化开始时间（用于计算总时间）
@@ -77,12 +117,42 @@ class FlashWorker(QObject):
         self.program_retry_delay = 50  # 编程数据重试延迟(ms)，默认50ms
         self.program_start_time = None  # 当前数据块发送开始时间
         self.program_timeout = 2000  # 单个数据块总超时时间(ms)
+        self.retry_backoff = 2.0  # 重试间隔递增倍率（1.0 即固定间隔）
+        self.retry_delay_cap = 500  # 重试间隔上限(ms)
+        self._cur_delay = 50  # 下一次重试间隔(ms)，每次发送新帧时重置为基准值
         self.logging_enabled_callback = None  # 日志启用状态回调函数
+        self._log_buf = []  # 编程阶段待合并发送的日志行
+        self._last_block_pct = -1  # 上次发出的编程进度百分比
+        self._frame_log_on = True  # 帧HEX信号是否有接收方（start_flash 时检测）
 
-        # 超时定时器
-        self.timeout_timer = QTimer()
+        # 超时定时器（以 worker 为父对象，随 moveToThread 一起迁移到烧录线程）
+        self.timeout_timer = QTimer(self)
         self.timeout_timer.setSingleShot(True)
         self.timeout_timer.timeout.connect(self._on_timeout)
+        # 延迟重试动作：由 timeout_timer 到期时执行，替代每次 QTimer.singleShot
+        self._timer_action = None
+
+        # 日志合并发送定时器：缓存非空时启动，到期后一次性发出
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        # 状态分发表：进入状态时执行的动作、等待状态下的回应处理
+        self._entry_actions = {
+            FlashState.INIT: self._send_init_command,
+            FlashState.ERASE: self._send_erase_command,
+            FlashState.PROGRAM: self._send_program_data,
+            FlashState.VERIFY: self._send_verify_command,
+            FlashState.SUCCESS: self._on_success,
+            FlashState.FAILED: self._on_failed,
+        }
+        self._response_handlers = {
+            FlashState.WAIT_INIT: self._handle_init_response,
+            FlashState.WAIT_ERASE: self._handle_erase_response,
+            FlashState.WAIT_PROGRAM: self._handle_program_response,
+            FlashState.WAIT_VERIFY: self._handle_verify_response,
+        }
 
     def set_logging_enabled_callback(self, callback):
         """设置日志启用状态回调函数
@@ -93,17 +163,67 @@ class FlashWorker(QObject):
         self.logging_enabled_callback = callback
 
     def _emit_log(self, message: str):
-        """根据日志配置发送日志信号"""
-        # 如果有回调函数，使用回调函数判断
-        if self.logging_enabled_callback:
-            if self.logging_enabled_callback():
-                self.sigLog.emit(message)
-        # 否则使用模块级配置
-        elif ENABLE_LOGGING:
+        """根据日志配置发送日志信号
+
+        编程阶段每块都会产生多行日志，先缓存，攒够 LOG_BATCH_LINES 行、
+        缓存超过 LOG_FLUSH_MS 或离开编程阶段、出现错误时再合并为一次信号发出。
+        """
+        if not self._logging_enabled():
+            return
+        # 调试模式需要逐步查看，不缓存
+        if not self.debug_mode and self.state in (FlashState.PROGRAM, FlashState.WAIT_PROGRAM):
+            self._log_buf.append(message)
+            if len(self._log_buf) >= self.LOG_BATCH_LINES:
+                self._flush_log()
+            elif not self._log_flush_timer.isActive():
+                self._log_flush_timer.start()
+        else:
+            self._flush_log()
             self.sigLog.emit(message)
 
+    def _flush_log(self):
+        """发出缓存的日志行"""
+        self._log_flush_timer.stop()
+        if self._log_buf:
+            self.sigLog.emit('\n'.join(self._log_buf))
+            self._log_buf.clear()
+
+    def _logging_enabled(self) -> bool:
+        """当前是否输出日志（回调优先，否则使用模块级配置）"""
+        if self.logging_enabled_callback:
+            return self.logging_enabled_callback()
+        return ENABLE_LOGGING
+
+    def _emit_block_progress(self):
+        """编程阶段进度：百分比未变化时不发信号（重试、窗口推进都会重复调用）"""
+        pct = int((self.current_block_index / len(self.data_blocks)) * 80) + 10
+        if pct == self._last_block_pct:
+            return
+        self._last_block_pct = pct
+        self.sigProgress.emit(pct, f"编程数据块 {self.current_block_index + 1}/{len(self.data_blocks)}...")
+
+    def _frame_signals_connected(self) -> bool:
+        """帧HEX信号（发送/接收）是否至少有一个接收方；无法判断时按已连接处理"""
+        try:
+            mo = self.metaObject()
+            for sig in ('sigFrameSent(QString)', 'sigFrameRecv(QString)'):
+                if self.isSignalConnected(mo.method(mo.indexOfSignal(sig))):
+                    return True
+            return False
+        except Exception:
+            return True
+
+    def _emit_frame(self, signal, frame):
+        """发送帧HEX信号；无接收方或日志关闭时界面不会显示，直接跳过整帧转HEX"""
+        if self._frame_log_on and self._logging_enabled():
+            signal.emit(frame.hex())
+
     def _log_error(self, err_type: str, expected: str, actual: str, frame: Optional[bytes]):
-        """统一记录错误并统计次数。"""
+        """统一记录错误并统计次数。
+
+        计数每次都更新；日志与错误详情信号在错误密集时限流输出，
+        非调试模式下只显示帧长度和帧头，不转换整帧HEX。
+        """
         self.err_total += 1
         if err_type == "CRC_MISMATCH":
             self.err_crc += 1
@@ -112,13 +232,29 @@ class FlashWorker(QObject):
         elif err_type == "DATA_MISMATCH":
             self.err_data += 1
 
-        frame_hex = frame.hex().upper() if frame else "(无帧)"
+        now = time.monotonic()
+        if not self.debug_mode and now - self._last_err_log_ts < self.ERR_LOG_INTERVAL \
+                and self.err_total % self.ERR_LOG_EVERY:
+            self._err_suppressed += 1
+            return
+        self._last_err_log_ts = now
+        suppressed, self._err_suppressed = self._err_suppressed, 0
+
+        if not frame:
+            frame_desc = "(无帧)"
+        elif self.debug_mode:
+            frame_desc = frame.hex().upper()
+        else:
+            frame_desc = f"len={len(frame)} head={frame[:16].hex().upper()}"
+        skipped = f" (另有{suppressed}条未显示)" if suppressed else ""
         self._emit_log(
             f"[ERROR] {err_type} #{self.err_total} (CRC:{self.err_crc},FMT:{self.err_format},DATA:{self.err_data}) "
-            f"期望:{expected} 实际:{actual} 帧:{frame_hex}"
+            f"期望:{expected} 实际:{actual} 帧:{frame_desc}{skipped}"
         )
         self.sigErrorDetail.emit(err_type, expected, actual)
+        self._flush_log()
 
+    @Slot(object, str, bool)
     def start_flash(self, ser, hex_file_path: str, debug_mode: bool = False):
         """开始烧录"""
         try:
@@ -131,15 +267,50 @@ class FlashWorker(QObject):
             self.verify_retries = 0
             self.debug_mode = debug_mode
             self.crc_accumulate_count = 0  # 重置累加计数器
-            self.accumulated_crc_list = []  # 重置CRC值列表
+            self._crc_strs = []  # 重置CRC文本
+            self._crc_lines = []
             self.err_crc = 0
             self.err_format = 0
             self.err_data = 0
             self.err_total = 0
+            self._last_err_log_ts = 0.0
+            self._err_suppressed = 0
             self.flash_start_ts = time.time()
 
+            # 逐块应答的往返延迟决定烧录速度，尽量关闭串口驱动的接收合并
+            if proto._enable_low_latency(ser):
+                self._emit_log("串口已启用低延迟模式")
+
             # 读取配置
             self.cfg = proto._read_protocol_cfg()
+            view = proto._cfg_view(self.cfg)
+            self._cs_algo = view.algo
+            self._cs_fn = view.cs_fn
+            self._cs_len = view.cs_len
+            self._pre_bytes = view.pre_bytes
+            self._pre_len = len(view.pre_bytes)
+            self._tx_start = view.tx_start
+            self._rx_start = view.rx_start
+            self._exp_init = f"{self._rx_start}HEX;"
+            self._exp_erase = f"{self._rx_start}HEX:ERASE;"
+            self._exp_reply_prefix = f"{self._rx_start}HEX:REPLY"
+            self._exp_init_b = self._exp_init.encode('ascii')
+            self._exp_erase_b = self._exp_erase.encode('ascii')
+            self._exp_reply_prefix_b = self._exp_reply_prefix.encode('ascii')
+            self._exp_init_rx = (self._build_frame(self._exp_init_b), self._exp_init_b)
+            self._exp_erase_rx = (self._build_frame(self._exp_erase_b), self._exp_erase_b)
+            tx_start_b = self._tx_start.encode('ascii')
+            self._program_hdr_prefix = tx_start_b + b'HEX:START'
+            self._verify_hdr = tx_start_b + b'HEX:ENDCRC'
+            # 重试退避参数可在 Protocol 配置中覆盖
+            self.retry_backoff = max(self._cfg_float('RetryBackoff', self.retry_backoff), 1.0)
+            self.retry_delay_cap = int(self._cfg_float('RetryMaxDelay', self.retry_delay_cap))
+            # 调试模式需要逐块手动推进，不使用窗口
+            self.window_size = 1 if debug_mode else max(int(self._cfg_float('ProgramWindow', 1)), 1)
+            self._ahead = {}
+            self._acked_ahead = set()
+            self._last_block_pct = -1
+            self._frame_log_on = self._frame_signals_connected()
 
             # 解析HEX文件
             self._emit_log(f"正在解析HEX文件: {hex_file_path}")
@@ -154,8 +325,13 @@ class FlashWorker(QObject):
                 self.sigCompleted.emit(False, "HEX文件无有效数据")
                 return
 
-            total_bytes = sum(len(block[1]) for block in self.data_blocks)
-            self._emit_log(f"HEX文件解析完成: {len(self.data_blocks)}个数据块, 共{total_bytes}字节")
+            self._total_bytes = sum(len(block[1]) for block in self.data_blocks)
+            self._erase_blocks = (self._total_bytes + 2047) // 2048  # 向上取整
+            # 初始化/擦除命令内容固定，整帧（含校验）预先构建，重试时直接发送
+            self._init_frame = self._build_frame(tx_start_b + b'HEX;')
+            self._erase_frame = self._build_frame(b'%sHEX:ESIZE%d;' % (tx_start_b, self._erase_blocks))
+            self._prepare_block_frames()
+            self._emit_log(f"HEX文件解析完成: {len(self.data_blocks)}个数据块, 共{self._total_bytes}字节")
             self.sigProgress.emit(0, "准备烧录...")
 
             # 开始状态机
@@ -164,11 +340,21 @@ class FlashWorker(QObject):
         except Exception as e:
             self.sigCompleted.emit(False, f"启动烧录失败: {str(e)}")
 
+    @Slot(str)
+    def handle_received_hex(self, hex_str: str):
+        """处理串口线程直接投递过来的HEX帧（排队连接，在烧录线程执行）"""
+        try:
+            frame = bytes.fromhex(hex_str)
+        except ValueError:
+            return
+        self.handle_received_frame(frame)
+
+    @Slot(bytes)
     def handle_received_frame(self, frame: bytes):
         """处理接收到的帧"""
         try:
             # 发出接收信号
-            self.sigFrameRecv.emit(frame.hex())
+            self._emit_frame(self.sigFrameRecv, frame)
 
             # 调试模式下只记录，不自动推进，等待手动“下一步”
             if self.debug_mode:
@@ -176,14 +362,9 @@ class FlashWorker(QObject):
                 return
 
             # 根据当前状态处理
-            if self.state == FlashState.WAIT_INIT:
-                self._handle_init_response(frame)
-            elif self.state == FlashState.WAIT_ERASE:
-                self._handle_erase_response(frame)
-            elif self.state == FlashState.WAIT_PROGRAM:
-                self._handle_program_response(frame)
-            elif self.state == FlashState.WAIT_VERIFY:
-                self._handle_verify_response(frame)
+            handler = self._response_handlers.get(self.state)
+            if handler is not None:
+                handler(frame)
 
         except Exception as e:
             self._emit_log(f"处理接收帧异常: {str(e)}")
@@ -191,31 +372,32 @@ class FlashWorker(QObject):
     def _transition_to(self, new_state: FlashState):
         """状态转换"""
         self.state = new_state
+        self._timer_action = None
         self.retry_count = 0
 
-        if new_state == FlashState.INIT:
-            self._send_init_command()
-        elif new_state == FlashState.ERASE:
-            self._send_erase_command()
-        elif new_state == FlashState.PROGRAM:
-            self._send_program_data()
-        elif new_state == FlashState.VERIFY:
-            self._send_verify_command()
-        elif new_state == FlashState.SUCCESS:
-            self.timeout_timer.stop()
-            if self.flash_start_ts is not None:
-                duration = time.time() - self.flash_start_ts
-                self._emit_log(f"烧录耗时 {duration:.2f} 秒")
-                self.flash_start_ts = None
-            self.sigProgress.emit(100, "烧录成功")
-            self.sigCompleted.emit(True, "固件烧录成功")
-        elif new_state == FlashState.FAILED:
-            self.timeout_timer.stop()
-            if self.flash_start_ts is not None:
-                duration = time.time() - self.flash_start_ts
-                self._emit_log(f"烧录耗时 {duration:.2f} 秒")
-                self.flash_start_ts = None
-            self.sigCompleted.emit(False, "固件烧录失败")
+        action = self._entry_actions.get(new_state)
+        if action is not None:
+            action()
+
+    def _log_duration(self):
+        """输出本次烧录耗时"""
+        if self.flash_start_ts is not None:
+            duration = time.time() - self.flash_start_ts
+            self._emit_log(f"烧录耗时 {duration:.2f} 秒")
+            self.flash_start_ts = None
+
+    def _on_success(self):
+        """进入成功状态"""
+        self.timeout_timer.stop()
+        self._log_duration()
+        self.sigProgress.emit(100, "烧录成功")
+        self.sigCompleted.emit(True, "固件烧录成功")
+
+    def _on_failed(self):
+        """进入失败状态"""
+        self.timeout_timer.stop()
+        self._log_duration()
+        self.sigCompleted.emit(False, "固件烧录失败")
 
     def _send_init_command(self, is_retry: bool = False):
         """发送初始化命令: !HEX;[CRC]
@@ -237,24 +419,23 @@ class FlashWorker(QObject):
                     return
                 self._emit_log(f"重试发送初始化命令 (已用时:{elapsed_ms:.0f}ms)...")
             
-            tx_start = (self.cfg.get('TxStart', '!') or '!')[0]
-            payload = f"{tx_start}HEX;".encode('ascii')
-            frame = self._build_frame(payload)
+            frame = self._init_frame
 
             self.ser.write(frame)
-            self.sigFrameSent.emit(frame.hex())
+            self._emit_frame(self.sigFrameSent, frame)
             self.last_sent_crc = self._get_frame_crc(frame)
 
             self.state = FlashState.WAIT_INIT
             self.sigProgress.emit(5, "等待初始化响应...")
             
-            # 首次发送：启动周期性重试定时器
+            # 首次发送：从用户设置的间隔开始，逐次退避重试
             if not is_retry and not self.debug_mode:
-                self.timeout_timer.start(self.init_retry_delay)  # 按用户设置的间隔触发重试
+                self._cur_delay = self.init_retry_delay
+                self._arm_timer(self._next_retry_delay())
 
             # 调试模式提示期望响应
             if self.debug_mode:
-                self._emit_expected(f"{(self.cfg.get('RxStart', '#') or '#')[0]}HEX;")
+                self._emit_expected(self._exp_init)
 
         except Exception as e:
             self._emit_log(f"发送初始化命令失败: {str(e)}")
@@ -263,34 +444,27 @@ class FlashWorker(QObject):
     def _handle_init_response(self, frame: bytes):
         """处理初始化响应: #HEX;[CRC]"""
         try:
-            # 提取实际接收的CRC
-            recv_crc = self._get_frame_crc(frame)
-            payload = self._extract_payload(frame)
-
-            # 计算期望的CRC
-            calc_crc = proto._checksum_bytes(payload, self.cfg.get('Checksum', 'CRC16_MODBUS'))
-
-            # 验证CRC
-            if recv_crc != calc_crc:
+            # 拆出payload并验证CRC
+            crc_ok, payload = self._split_and_verify(frame, self._exp_init_rx)
+            if not crc_ok:
                 self.timeout_timer.stop()  # 停止周期性定时器
-                self._log_error("CRC_MISMATCH", calc_crc.hex().upper(), recv_crc.hex().upper(), frame)
+                self._log_crc_mismatch(frame, payload)
                 self._retry_or_fail(5000, immediate=True)
                 return
 
             # 解析响应
-            rx_start = (self.cfg.get('RxStart', '#') or '#')[0]
-            expected = f"{rx_start}HEX;"
-            received = payload.decode('ascii', errors='ignore')
+            expected = self._exp_init
 
-            if received == expected:
+            if payload == self._exp_init_b:
                 self._emit_log("初始化成功")
-                self.sigVerifyOk.emit(expected, received)
+                self.sigVerifyOk.emit(expected, expected)
                 self.timeout_timer.stop()
                 self.consecutive_errors = 0  # 重置连续错误计数
                 self._transition_to(FlashState.ERASE)
             else:
                 self.timeout_timer.stop()  # 停止周期性定时器
                 self._emit_log(f"初始化响应格式错误")
+                received = payload.decode('ascii', errors='ignore')
                 self._log_error("FORMAT_ERROR", expected, received, frame)
                 self._retry_or_fail(5000)
 
@@ -301,25 +475,20 @@ class FlashWorker(QObject):
     def _send_erase_command(self):
         """发送擦除命令: !HEX:ESIZE[size/2048];[CRC]"""
         try:
-            # 计算固件大小 (字节数 / 2048)
-            total_bytes = sum(len(block[1]) for block in self.data_blocks)
-            erase_blocks = (total_bytes + 2047) // 2048  # 向上取整
-
-            self._emit_log(f"发送擦除命令 (擦除{erase_blocks}个块)...")
-            tx_start = (self.cfg.get('TxStart', '!') or '!')[0]
-            payload = f"{tx_start}HEX:ESIZE{erase_blocks};".encode('ascii')
-            frame = self._build_frame(payload)
+            # 擦除块数与整帧均在 start_flash 中算好，重试时直接重发
+            self._emit_log(f"发送擦除命令 (擦除{self._erase_blocks}个块)...")
+            frame = self._erase_frame
 
             self.ser.write(frame)
-            self.sigFrameSent.emit(frame.hex())
+            self._emit_frame(self.sigFrameSent, frame)
             self.last_sent_crc = self._get_frame_crc(frame)
 
             self.state = FlashState.WAIT_ERASE
             if not self.debug_mode:
-                self.timeout_timer.start(10000)  # 10秒超时
+                self._arm_timer(10000)  # 10秒超时
             self.sigProgress.emit(10, "等待擦除完成...")
 
-            self._emit_expected(f"{(self.cfg.get('RxStart', '#') or '#')[0]}HEX:ERASE;")
+            self._emit_expected(self._exp_erase)
 
         except Exception as e:
             self._emit_log(f"发送擦除命令失败: {str(e)}")
@@ -328,33 +497,26 @@ class FlashWorker(QObject):
     def _handle_erase_response(self, frame: bytes):
         """处理擦除响应: #HEX:ERASE;[CRC]"""
         try:
-            # 提取实际接收的CRC
-            recv_crc = self._get_frame_crc(frame)
-            payload = self._extract_payload(frame)
-
-            # 计算期望的CRC
-            calc_crc = proto._checksum_bytes(payload, self.cfg.get('Checksum', 'CRC16_MODBUS'))
-
-            # 验证CRC
-            if recv_crc != calc_crc:
-                self._log_error("CRC_MISMATCH", calc_crc.hex().upper(), recv_crc.hex().upper(), frame)
+            # 拆出payload并验证CRC
+            crc_ok, payload = self._split_and_verify(frame, self._exp_erase_rx)
+            if not crc_ok:
+                self._log_crc_mismatch(frame, payload)
                 self._retry_or_fail(10000, immediate=True)
                 return
 
             # 解析响应
-            rx_start = (self.cfg.get('RxStart', '#') or '#')[0]
-            expected = f"{rx_start}HEX:ERASE;"
-            received = payload.decode('ascii', errors='ignore')
+            expected = self._exp_erase
 
-            if received == expected:
+            if payload == self._exp_erase_b:
                 self._emit_log("擦除成功")
-                self.sigVerifyOk.emit(expected, received)
+                self.sigVerifyOk.emit(expected, expected)
                 self.timeout_timer.stop()
                 self.consecutive_errors = 0  # 重置连续错误计数
                 self.total_data_crc = 0
                 self._transition_to(FlashState.PROGRAM)
             else:
                 self._emit_log(f"擦除响应格式错误")
+                received = payload.decode('ascii', errors='ignore')
                 self._log_error("FORMAT_ERROR", expected, received, frame)
                 self._retry_or_fail(10000)
 
@@ -391,7 +553,6 @@ class FlashWorker(QObject):
             # 注意：不要在发送阶段累加数据块CRC，避免重试导致重复累加
             # 改为在收到该块成功回复后再累加（见 _handle_program_response）
 
-            progress = int((self.current_block_index / len(self.data_blocks)) * 80) + 10
             if is_retry:
                 elapsed_ms = (time.time() - self.program_start_time) * 1000
                 self._emit_log(f"重试发送数据块 {self.current_block_index + 1}/{len(self.data_blocks)} " +
@@ -400,50 +561,80 @@ class FlashWorker(QObject):
                 self._emit_log(f"发送数据块 {self.current_block_index + 1}/{len(self.data_blocks)} " +
                                f"(地址:0x{address:08X}, 大小:{len(data)}字节)")
 
-            tx_start = (self.cfg.get('TxStart', '!') or '!')[0]
-            # DATA后直接跟原始二进制数据，而不是ASCII字符串
-            header = f"{tx_start}HEX:START{address:08X},SIZE{len(data)},DATA".encode('ascii')
-            payload = header + data + b';'
-            frame = self._build_frame(payload)
-
+            frame = self._block_frames[self.current_block_index]
             self.ser.write(frame)
-            self.sigFrameSent.emit(frame.hex())
-            self.last_sent_crc = self._get_frame_crc(frame)
+            self._emit_frame(self.sigFrameSent, frame)
+            self.last_sent_crc = self._block_crcs[self.current_block_index]
 
             self.state = FlashState.WAIT_PROGRAM
-            self.sigProgress.emit(progress, f"编程数据块 {self.current_block_index + 1}/{len(self.data_blocks)}...")
+            self._emit_block_progress()
 
-            # 首次发送：启动周期性重试定时器
+            # 首次发送：从用户设置的间隔开始，逐次退避重试
             if not is_retry and not self.debug_mode:
-                self.timeout_timer.start(self.program_retry_delay)  # 按用户设置的间隔触发重试
+                self._cur_delay = self.program_retry_delay
+                self._arm_timer(self._next_retry_delay())
 
             if self.last_sent_crc:
                 exp_crc = self.last_sent_crc.hex().upper()
-                # 显示期望的回复格式（小端和大端两种可能）
-                crc_le = int.from_bytes(self.last_sent_crc, byteorder='little')
-                crc_be = int.from_bytes(self.last_sent_crc, byteorder='big')
-                self._emit_log(f"发送帧CRC: {exp_crc} (小端:0x{crc_le:04X}, 大端:0x{crc_be:04X})")
-                self._emit_log(f"期望下位机回复: #HEX:REPLY{crc_le:X}; 或 #HEX:REPLY{crc_be:X}; (ASCII格式)")
+                if self._logging_enabled():
+                    # 显示期望的回复格式（小端和大端两种可能）
+                    crc_le = int.from_bytes(self.last_sent_crc, byteorder='little')
+                    crc_be = int.from_bytes(self.last_sent_crc, byteorder='big')
+                    self._emit_log(f"发送帧CRC: {exp_crc} (小端:0x{crc_le:04X}, 大端:0x{crc_be:04X})")
+                    self._emit_log(f"期望下位机回复: #HEX:REPLY{crc_le:X}; 或 #HEX:REPLY{crc_be:X}; (ASCII格式)")
             else:
                 exp_crc = "(未知CRC)"
             if self.debug_mode:
-                self._emit_expected(f"{(self.cfg.get('RxStart', '#') or '#')[0]}HEX:REPLY[{exp_crc}]")
+                self._emit_expected(f"{self._rx_start}HEX:REPLY[{exp_crc}]")
+
+            if self.window_size > 1:
+                self._fill_window()
 
         except Exception as e:
             self._emit_log(f"发送编程数据失败: {str(e)}")
             self._transition_to(FlashState.FAILED)
 
+    def _fill_window(self):
+        """窗口模式：在当前块之后继续发出数据块，直到未确认的块数达到 window_size"""
+        nxt = self.current_block_index + 1 + len(self._ahead)
+        while len(self._ahead) + 1 < self.window_size and nxt < len(self.data_blocks):
+            frame = self._block_frames[nxt]
+            self.ser.write(frame)
+            self._emit_frame(self.sigFrameSent, frame)
+            self._ahead[nxt] = self._block_crcs[nxt]
+            self._emit_log(f"提前发送数据块 {nxt + 1}/{len(self.data_blocks)} (窗口内未确认:{len(self._ahead) + 1})")
+            nxt += 1
+
+    def _advance_window(self):
+        """窗口模式：当前块确认后，转为等待下一个已发出块的回复；没有已发出的块时按常规发送"""
+        while True:
+            crc = self._ahead.pop(self.current_block_index, None)
+            if crc is None:
+                self._transition_to(FlashState.PROGRAM)
+                return
+            self.last_sent_crc = crc
+            if self.current_block_index not in self._acked_ahead:
+                break
+            # 该块的确认已提前到达
+            self._acked_ahead.discard(self.current_block_index)
+            self._accumulate_frame_crc()
+            self.current_block_index += 1
+
+        self.retry_count = 0
+        self.program_start_time = time.time()
+        self._emit_block_progress()
+        self._cur_delay = self.program_retry_delay
+        self._arm_timer(self._next_retry_delay())
+        self._fill_window()
+
     def _handle_program_response(self, frame: bytes):
         """处理编程响应: #HEX:REPLY[上一帧CRC];[CRC]"""
         try:
-            # 提取负载与帧CRC
-            recv_crc = self._get_frame_crc(frame)
-            payload = self._extract_payload(frame)
-
-            rx_start = (self.cfg.get('RxStart', '#') or '#')[0]
-            expected_prefix = f"{rx_start}HEX:REPLY"
-            algo = self.cfg.get('Checksum', 'CRC16_MODBUS').upper()
-            field_len = 2 if algo == 'CRC16_MODBUS' else (1 if algo == 'SUM8' else 0)
+            # 提取负载并验证帧CRC（结果在长度检查之后再使用）
+            crc_ok, payload = self._split_and_verify(frame, self._block_replies[self.current_block_index])
+
+            expected_prefix = self._exp_reply_prefix
+            field_len = self._cs_len
             prefix_len = len(expected_prefix)
             required_len = prefix_len + field_len + 1  # REPLY + CRC字段 + ';'
 
@@ -455,133 +646,136 @@ class FlashWorker(QObject):
                 return
 
             # 验证帧CRC（在长度满足后再验，避免截断引起的无谓重试）
-            calc_crc = proto._checksum_bytes(payload, self.cfg.get('Checksum', 'CRC16_MODBUS'))
-            if recv_crc != calc_crc:
-                self._log_error("CRC_MISMATCH", calc_crc.hex().upper(), recv_crc.hex().upper(), frame)
+            if not crc_ok:
+                self._log_crc_mismatch(frame, payload)
                 self._retry_or_fail(2000, immediate=True)
                 return
 
             # 解析响应: #HEX:REPLY[上一帧CRC 2字节原始数据];[CRC]
-            if not payload.startswith(expected_prefix.encode('ascii')):
-                self.timeout_timer.stop()  # 停止周期性定时器
-                payload_str = payload.decode('ascii', errors='ignore')
-                self._log_error("FORMAT_ERROR", f"{expected_prefix}[2字节];", payload_str, frame)
-                self._retry_or_fail(2000)
-                return
-
-            # 解析响应: #HEX:REPLY[上一帧CRC 2字节];
             # payload只包含到第一个分号，帧CRC在payload外面
-            if not payload.startswith(expected_prefix.encode('ascii')):
-                self.timeout_timer.stop()
+            if not payload.startswith(self._exp_reply_prefix_b):
+                self.timeout_timer.stop()  # 停止周期性定时器
                 payload_str = payload.decode('ascii', errors='ignore')
                 self._log_error("FORMAT_ERROR", f"{expected_prefix}[2字节];", payload_str, frame)
                 self._retry_or_fail(2000)
                 return
 
-            # 固定格式：REPLY前缀(10字节) + 回复CRC(2字节) + ';' = 13字节
-            required_len = prefix_len + field_len + 1
-            
-            if len(payload) < required_len:
-                payload_str = payload.decode('ascii', errors='ignore')
-                self._emit_log(f"payload长度不足: 需要{required_len}字节, 实际{len(payload)}字节, 内容:{payload_str}")
-                self._log_error("FORMAT_ERROR", f"{expected_prefix}[2字节];", payload_str, frame)
-                self._retry_or_fail(2000)
-                return
-            
-            # 按固定偏移提取回复CRC
-            reply_crc_bytes = payload[prefix_len:prefix_len + field_len]
-            
-            # 检查分号
+            # 固定格式：REPLY前缀(10字节) + 回复CRC(2字节) + ';' = 13字节，长度已在上面检查
+            # 检查分号（按下标取值，不切片）
             semicolon_pos = prefix_len + field_len
-            if payload[semicolon_pos:semicolon_pos + 1] != b';':
+            if payload[semicolon_pos] != 0x3B:
                 payload_str = payload.decode('ascii', errors='ignore')
                 self._emit_log(f"分号位置错误 (pos={semicolon_pos}): 期望';', 实际0x{payload[semicolon_pos]:02X}")
                 self._log_error("FORMAT_ERROR", f"{expected_prefix}[2字节];", payload_str, frame)
                 self._retry_or_fail(2000)
                 return
-            
-            # 记录解析结果
-            self._emit_log(f"解析PROGRAM回复: 上一帧CRC={reply_crc_bytes.hex().upper()}")
 
-            # 验证回复的上一帧CRC是否匹配发送的帧CRC
-            if self.last_sent_crc:
+            # 验证回复的上一帧CRC是否匹配发送的帧CRC（在 payload 内原地比较，不切片）
+            if self.last_sent_crc and not payload.startswith(self.last_sent_crc, prefix_len):
+                reply_crc_bytes = payload[prefix_len:semicolon_pos]
+                # 窗口模式：可能是提前发出的后续块先得到确认，记下后继续等待当前块
+                for idx, crc in self._ahead.items():
+                    if crc == reply_crc_bytes:
+                        self._acked_ahead.add(idx)
+                        self._emit_log(f"数据块 {idx + 1} 已提前确认，继续等待数据块 {self.current_block_index + 1}")
+                        return
                 sent_crc_hex = self.last_sent_crc.hex().upper()
                 reply_crc_hex = reply_crc_bytes.hex().upper()
                 sent_crc_int = int.from_bytes(self.last_sent_crc, byteorder='little')
                 reply_crc_int = int.from_bytes(reply_crc_bytes, byteorder='little')
-                
-                if reply_crc_bytes != self.last_sent_crc:
-                    self.timeout_timer.stop()  # 停止周期性定时器
-                    # 详细的错误信息
-                    self._emit_log(f"❌ 上一帧CRC不匹配:")
-                    self._emit_log(f"  发送帧CRC: {sent_crc_hex} = 0x{sent_crc_int:04X}(小端)")
-                    self._emit_log(f"  下位机回复: {reply_crc_hex} = 0x{reply_crc_int:04X}(小端)")
-                    self._emit_log(f"  本帧CRC: {frame_crc_bytes.hex().upper()}")
-                    self._log_error("DATA_MISMATCH", sent_crc_hex, reply_crc_hex, frame)
-                    self._retry_or_fail(2000)
-                    return
+                self.timeout_timer.stop()  # 停止周期性定时器
+                # 详细的错误信息
+                self._emit_log(f"❌ 上一帧CRC不匹配:")
+                self._emit_log(f"  发送帧CRC: {sent_crc_hex} = 0x{sent_crc_int:04X}(小端)")
+                self._emit_log(f"  下位机回复: {reply_crc_hex} = 0x{reply_crc_int:04X}(小端)")
+                self._emit_log(f"  本帧CRC: {self._get_frame_crc(frame).hex().upper()}")
+                self._log_error("DATA_MISMATCH", sent_crc_hex, reply_crc_hex, frame)
+                self._retry_or_fail(2000)
+                return
 
-            self._emit_log(f"✓ 数据块 {self.current_block_index + 1} 编程成功 (上一帧CRC={reply_crc_bytes.hex().upper()})")
             if self.last_sent_crc:
-                self.sigVerifyOk.emit(self.last_sent_crc.hex().upper(), reply_crc_bytes.hex().upper())
+                # 回复CRC与发送帧CRC相同，只需格式化一次
+                crc_hex = self.last_sent_crc.hex().upper()
+                self._emit_log(f"✓ 数据块 {self.current_block_index + 1} 编程成功 (上一帧CRC={crc_hex})")
+                self.sigVerifyOk.emit(crc_hex, crc_hex)
+            else:
+                self._emit_log(f"✓ 数据块 {self.current_block_index + 1} 编程成功 (上一帧CRC={payload[prefix_len:semicolon_pos].hex().upper()})")
 
             # 在收到成功回复后，累加该数据帧的帧CRC到总CRC（避免重试重复累加）
             # 帧CRC = last_sent_crc（已在发送时计算）
-            try:
-                if self.last_sent_crc:
-                    frame_crc = int.from_bytes(self.last_sent_crc, byteorder='little')  # 小端转整数
-                    self.total_data_crc = (self.total_data_crc + frame_crc) & 0xFFFF
-                    self.crc_accumulate_count += 1
-                    self.accumulated_crc_list.append(frame_crc)  # 保存帧CRC
-                    self._emit_log(f"[累加{self.crc_accumulate_count}次] 块{self.current_block_index + 1} 帧CRC=0x{frame_crc:04X}, 累计总CRC=0x{self.total_data_crc:04X}")
-            except Exception:
-                pass
+            if self.last_sent_crc:
+                self._accumulate_frame_crc()
 
             self.timeout_timer.stop()
             self.consecutive_errors = 0  # 重置连续错误计数
 
             # 继续下一个数据块
             self.current_block_index += 1
-            self._transition_to(FlashState.PROGRAM)
+            if self._ahead:
+                self._advance_window()
+            else:
+                self._transition_to(FlashState.PROGRAM)
 
         except Exception as e:
             self._emit_log(f"处理编程响应异常: {str(e)}")
             self._retry_or_fail(2000)
 
+    def _accumulate_frame_crc(self):
+        """把上一帧的帧CRC累加到总CRC
+
+        日志开启时顺带格式化该值，每满8个拼成一行，校验前无需再整体格式化；
+        日志关闭时不保留任何列表。
+        """
+        crc = self.last_sent_crc
+        # 小端转整数；CRC16 为固定2字节，走 struct 快速路径
+        frame_crc = _U16LE(crc)[0] if len(crc) == 2 else int.from_bytes(crc, 'little')
+        self.total_data_crc = (self.total_data_crc + frame_crc) & 0xFFFF
+        self.crc_accumulate_count += 1
+        if not self._logging_enabled():
+            return
+        self._crc_strs.append(f"0x{frame_crc:04X}")
+        if len(self._crc_strs) == 8:
+            self._crc_lines.append(f"  {', '.join(self._crc_strs)}")
+            self._crc_strs.clear()
+        self._emit_log(f"[累加{self.crc_accumulate_count}次] 块{self.current_block_index + 1} 帧CRC=0x{frame_crc:04X}, 累计总CRC=0x{self.total_data_crc:04X}")
+
     def _send_verify_command(self):
         """发送校验命令: !HEX:ENDCRC[total_crc];[CRC]"""
         try:
-            # 输出所有参与累加的帧CRC值
-            self._emit_log(f"=" * 60)
-            self._emit_log(f"参与累加的帧CRC列表 (共{len(self.accumulated_crc_list)}个):")
-            self._emit_log(f"说明: 每个值是对应数据帧的帧CRC（小端格式整数），ENDCRC = 所有帧CRC直接相加")
-            crc_str_list = []
-            for i, crc in enumerate(self.accumulated_crc_list):
-                crc_str_list.append(f"0x{crc:04X}")
-                if (i + 1) % 8 == 0:
-                    self._emit_log(f"  {', '.join(crc_str_list)}")
-                    crc_str_list = []
-            if crc_str_list:  # 输出剩余的
-                self._emit_log(f"  {', '.join(crc_str_list)}")
-            self._emit_log(f"=" * 60)
+            # 输出所有参与累加的帧CRC值（累加时已按每行8个格式化好）
+            if self._logging_enabled():
+                lines = [
+                    "=" * 60,
+                    f"参与累加的帧CRC列表 (共{self.crc_accumulate_count}个):",
+                    "说明: 每个值是对应数据帧的帧CRC（小端格式整数），ENDCRC = 所有帧CRC直接相加",
+                ]
+                lines.extend(self._crc_lines)
+                if self._crc_strs:
+                    lines.append(f"  {', '.join(self._crc_strs)}")
+                lines.append("=" * 60)
+                self._emit_log('\n'.join(lines))
             self._emit_log(f"发送校验命令 (总CRC:0x{self.total_data_crc:04X})...")
-            tx_start = (self.cfg.get('TxStart', '!') or '!')[0]
             # ENDCRC后跟2字节的原始CRC数据（大端序），而不是ASCII字符串
-            header = f"{tx_start}HEX:ENDCRC".encode('ascii')
             crc_bytes = self.total_data_crc.to_bytes(2, byteorder='big')
-            payload = header + crc_bytes + b';'
+            # 设备常以4位ASCII十六进制回复总CRC（大端或小端），预先格式化好用于直接比较
+            self._verify_ascii_ok = {}
+            if self._cs_len == 2:
+                for raw in (crc_bytes, crc_bytes[::-1]):
+                    self._verify_ascii_ok[raw.hex().upper().encode('ascii')] = raw
+                    self._verify_ascii_ok[raw.hex().encode('ascii')] = raw
+            payload = self._verify_hdr + crc_bytes + b';'
             frame = self._build_frame(payload)
 
             self.ser.write(frame)
-            self.sigFrameSent.emit(frame.hex())
+            self._emit_frame(self.sigFrameSent, frame)
             self.last_sent_crc = self._get_frame_crc(frame)
 
             self.state = FlashState.WAIT_VERIFY
             if not self.debug_mode:
-                self.timeout_timer.start(2000)  # 2秒超时
+                self._arm_timer(2000)  # 2秒超时
             self.sigProgress.emit(95, "等待校验结果...")
 
-            self._emit_expected(f"{(self.cfg.get('RxStart', '#') or '#')[0]}HEX:REPLY[{self.total_data_crc:04X}]")
+            self._emit_expected(f"{self._rx_start}HEX:REPLY[{self.total_data_crc:04X}]")
 
         except Exception as e:
             self._emit_log(f"发送校验命令失败: {str(e)}")
@@ -593,35 +787,31 @@ class FlashWorker(QObject):
         注意：设备返回的 [总CRC] 为原始二进制2字节，通常为小端序，不能按ASCII解析。
         """
         try:
-            # 提取实际接收的帧CRC与负载
-            recv_crc = self._get_frame_crc(frame)
-            payload = self._extract_payload(frame)
-
-            rx_start = (self.cfg.get('RxStart', '#') or '#')[0]
-            expected_prefix = f"{rx_start}HEX:REPLY".encode('ascii')
-            algo = self.cfg.get('Checksum', 'CRC16_MODBUS').upper()
-            field_len = 2 if algo == 'CRC16_MODBUS' else (1 if algo == 'SUM8' else 0)
+            # 提取负载并验证帧CRC（结果在长度检查之后再使用）
+            crc_ok, payload = self._split_and_verify(frame)
+
+            expected_prefix = self._exp_reply_prefix_b
+            field_len = self._cs_len
             prefix_len = len(expected_prefix)
             required_len = prefix_len + field_len + 1
 
             # 先做长度检查，避免截断帧被误判为CRC错误
             if len(payload) < required_len:
                 payload_str = payload.decode('ascii', errors='ignore')
-                self._log_error("FORMAT_ERROR", f"{(self.cfg.get('RxStart', '#') or '#')[0]}HEX:REPLY[{field_len}字节];", f"LEN={len(payload)} PAYLOAD={payload_str}", frame)
+                self._log_error("FORMAT_ERROR", f"{self._rx_start}HEX:REPLY[{field_len}字节];", f"LEN={len(payload)} PAYLOAD={payload_str}", frame)
                 self._transition_to(FlashState.FAILED)
                 return
 
             # 帧CRC校验（在长度满足后进行）
-            calc_crc = proto._checksum_bytes(payload, self.cfg.get('Checksum', 'CRC16_MODBUS'))
-            if recv_crc != calc_crc:
-                self._log_error("CRC_MISMATCH", calc_crc.hex().upper(), recv_crc.hex().upper(), frame)
+            if not crc_ok:
+                self._log_crc_mismatch(frame, payload)
                 self._retry_or_fail(2000, immediate=True)
                 return
 
             # 检查前缀
             if not payload.startswith(expected_prefix):
                 payload_str = payload.decode('ascii', errors='ignore')
-                self._log_error("FORMAT_ERROR", f"{(self.cfg.get('RxStart', '#') or '#')[0]}HEX:REPLY[hex];", payload_str, frame)
+                self._log_error("FORMAT_ERROR", f"{self._rx_start}HEX:REPLY[hex];", payload_str, frame)
                 self._retry_or_fail(2000, immediate=True)
                 return
 
@@ -630,32 +820,33 @@ class FlashWorker(QObject):
             semicolon_pos = payload.find(b';', prefix_len)
             if semicolon_pos == -1:
                 payload_str = payload.decode('ascii', errors='ignore')
-                self._log_error("FORMAT_ERROR", f"{(self.cfg.get('RxStart', '#') or '#')[0]}HEX:REPLY[CRC];", payload_str, frame)
+                self._log_error("FORMAT_ERROR", f"{self._rx_start}HEX:REPLY[CRC];", payload_str, frame)
                 self._retry_or_fail(2000, immediate=True)
                 return
             
             # 提取 REPLY 后到分号之间的内容
             crc_field = payload[prefix_len:semicolon_pos]
-            reply_crc_bytes = None
-            
-            # 方法1: 尝试作为 ASCII 十六进制字符串解析（如 "A950"）
-            try:
-                crc_str = crc_field.decode('ascii')
-                # 期望 2*field_len 个字符（如 CRC16 是 4 个字符）
-                if len(crc_str) in [field_len * 2, field_len]:  # 兼容完整或简化格式
-                    crc_int = int(crc_str, 16)
-                    # 先按大端存储（因为 ENDCRC 发送的是大端）
-                    reply_crc_bytes = crc_int.to_bytes(field_len, byteorder='big')
-                    self._emit_log(f"解析 ASCII 十六进制总 CRC: '{crc_str}' -> 0x{crc_int:04X} -> {reply_crc_bytes.hex().upper()}")
-            except (ValueError, UnicodeDecodeError):
-                # 方法2: 作为原始字节处理（原有逻辑）
-                if len(crc_field) == field_len:
-                    reply_crc_bytes = crc_field
-                    self._emit_log(f"解析原始字节总 CRC: {reply_crc_bytes.hex().upper()}")
-            
+            # 最常见的回复是4位ASCII十六进制的期望值，直接查表，无需解析
+            reply_crc_bytes = self._verify_ascii_ok.get(crc_field)
+            if reply_crc_bytes is None:
+                # 方法1: 尝试作为 ASCII 十六进制字符串解析（如 "A950"）
+                # int() 可直接解析 bytes，非 ASCII 十六进制时抛 ValueError，无需先整体解码
+                try:
+                    # 期望 2*field_len 个字符（如 CRC16 是 4 个字符）
+                    if len(crc_field) in (field_len * 2, field_len):  # 兼容完整或简化格式
+                        crc_int = int(crc_field, 16)
+                        # 先按大端存储（因为 ENDCRC 发送的是大端）
+                        reply_crc_bytes = crc_int.to_bytes(field_len, byteorder='big')
+                        self._emit_log(f"解析 ASCII 十六进制总 CRC: '{crc_field.decode('ascii')}' -> 0x{crc_int:04X} -> {reply_crc_bytes.hex().upper()}")
+                except ValueError:
+                    # 方法2: 作为原始字节处理（原有逻辑）
+                    if len(crc_field) == field_len:
+                        reply_crc_bytes = crc_field
+                        self._emit_log(f"解析原始字节总 CRC: {reply_crc_bytes.hex().upper()}")
+
             if reply_crc_bytes is None:
                 payload_str = payload.decode('ascii', errors='ignore')
-                self._log_error("FORMAT_ERROR", f"{(self.cfg.get('RxStart', '#') or '#')[0]}HEX:REPLY[{field_len * 2}位ASCII十六进制或{field_len}字节];", payload_str, frame)
+                self._log_error("FORMAT_ERROR", f"{self._rx_start}HEX:REPLY[{field_len * 2}位ASCII十六进制或{field_len}字节];", payload_str, frame)
                 self._retry_or_fail(2000, immediate=True)
                 return
 
@@ -686,18 +877,47 @@ class FlashWorker(QObject):
             self._transition_to(FlashState.FAILED)
 
     def _build_frame(self, payload: bytes) -> bytes:
-        """构建完整帧"""
-        preamble = self.cfg.get('Preamble', 'FC')
-        pre_bytes = bytes.fromhex(preamble) if preamble else b''
-        algo = self.cfg.get('Checksum', 'CRC16_MODBUS')
-        cs = proto._checksum_bytes(payload, algo)
-        return pre_bytes + payload + cs
+        """构建完整帧（一次拼接，不产生中间 bytes）"""
+        return b''.join((self._pre_bytes, payload, self._cs_fn(payload)))
+
+    def _build_program_frame(self, header: bytes, data: bytes) -> bytearray:
+        """拼装数据帧: 前导 + header + data + ';' + CRC（一次分配，原地写入）"""
+        pre = self._pre_len
+        data_start = pre + len(header)
+        end = data_start + len(data) + 1
+        buf = bytearray(end + self._cs_len)
+        buf[:pre] = self._pre_bytes
+        buf[pre:data_start] = header
+        buf[data_start:end - 1] = data
+        buf[end - 1] = 0x3B  # ';'
+        buf[end:] = self._cs_fn(memoryview(buf)[pre:end])
+        return buf
+
+    def _prepare_block_frames(self):
+        """为所有数据块预先构建发送帧、帧CRC和期望回应，发送/重发/校验回应时只按序号取用"""
+        frames = []
+        crcs = []
+        replies = []
+        for address, data in self.data_blocks:
+            # DATA后直接跟原始二进制数据，而不是ASCII字符串
+            header = self._program_hdr_prefix + b'%08X,SIZE%d,DATA' % (address, len(data))
+            frame = self._build_program_frame(header, data)
+            crc = self._get_frame_crc(frame)
+            # pyserial 的 write 会先把 bytearray 复制成 bytes，这里一次转好，每次发送/重发不再复制整帧
+            frames.append(bytes(frame))
+            crcs.append(crc)
+            reply = self._exp_reply_prefix_b + crc + b';'
+            replies.append((self._build_frame(reply), reply))
+        self._block_frames = frames
+        self._block_crcs = crcs
+        self._block_replies = replies
 
     def _emit_expected(self, expected_text: str):
         """调试模式下提示期望响应内容"""
         if self.debug_mode:
             self._emit_log(f"调试模式提示：期望收到 {expected_text}")
 
+    @Slot()
     def step_next(self):
         """调试模式下手动进入下一步"""
         if not self.debug_mode:
@@ -721,15 +941,8 @@ class FlashWorker(QObject):
             self.consecutive_errors = 0
             
             # 调试模式跳过时，也要累加当前帧的帧CRC（模拟成功场景）
-            try:
-                if self.last_sent_crc:
-                    frame_crc = int.from_bytes(self.last_sent_crc, byteorder='little')  # 小端转整数
-                    self.total_data_crc = (self.total_data_crc + frame_crc) & 0xFFFF
-                    self.crc_accumulate_count += 1
-                    self.accumulated_crc_list.append(frame_crc)  # 保存帧CRC
-                    self._emit_log(f"[累加{self.crc_accumulate_count}次] 块{self.current_block_index + 1} 帧CRC=0x{frame_crc:04X}, 累计总CRC=0x{self.total_data_crc:04X}")
-            except Exception:
-                pass
+            if self.last_sent_crc:
+                self._accumulate_frame_crc()
             
             self.current_block_index += 1
             self._transition_to(FlashState.PROGRAM)
@@ -743,34 +956,29 @@ class FlashWorker(QObject):
 
     def _get_frame_crc(self, frame: bytes) -> bytes:
         """获取帧的CRC部分"""
-        algo = self.cfg.get('Checksum', 'CRC16_MODBUS').upper()
-        cs_len = 2 if algo == 'CRC16_MODBUS' else (1 if algo == 'SUM8' else 0)
-        return frame[-cs_len:] if cs_len else b''
-
-    def _verify_frame_crc(self, frame: bytes) -> bool:
-        """验证帧CRC"""
-        preamble = self.cfg.get('Preamble', 'FC')
-        pre_len = len(bytes.fromhex(preamble)) if preamble else 0
-        algo = self.cfg.get('Checksum', 'CRC16_MODBUS').upper()
-        cs_len = 2 if algo == 'CRC16_MODBUS' else (1 if algo == 'SUM8' else 0)
-
-        if len(frame) < pre_len + 1 + cs_len:
-            return False
-
-        payload = frame[pre_len:len(frame)-cs_len] if cs_len else frame[pre_len:]
-        cs_recv = frame[len(frame)-cs_len:] if cs_len else b''
-        cs_calc = proto._checksum_bytes(payload, algo)
-
-        return cs_recv == cs_calc
+        cs_len = self._cs_len
+        # 转为 bytes，数据块发送帧为 bytearray
+        return bytes(frame[-cs_len:]) if cs_len else b''
 
-    def _extract_payload(self, frame: bytes) -> bytes:
-        """提取帧的payload部分"""
-        preamble = self.cfg.get('Preamble', 'FC')
-        pre_len = len(bytes.fromhex(preamble)) if preamble else 0
-        algo = self.cfg.get('Checksum', 'CRC16_MODBUS').upper()
-        cs_len = 2 if algo == 'CRC16_MODBUS' else (1 if algo == 'SUM8' else 0)
+    def _split_and_verify(self, frame: bytes, expected: Optional[Tuple[bytes, bytes]] = None) -> Tuple[bool, bytes]:
+        """拆出帧的payload并验证帧CRC，返回 (CRC是否正确, payload)
 
-        return frame[pre_len:len(frame)-cs_len] if cs_len else frame[pre_len:]
+        expected 为预先构建的 (期望完整帧, 期望payload)；收到的帧与之逐字节相同时
+        CRC必然正确，直接返回，不再计算。
+        """
+        if expected is not None and frame == expected[0]:
+            return True, expected[1]
+        end = len(frame) - self._cs_len
+        payload = frame[self._pre_len:end]
+        if not self._cs_len:
+            return True, payload
+        return self._cs_fn(payload) == frame[end:], payload
+
+    def _log_crc_mismatch(self, frame: bytes, payload: bytes):
+        """记录帧CRC错误（仅在出错时才重新计算用于显示）"""
+        calc_crc = self._cs_fn(payload)
+        recv_crc = self._get_frame_crc(frame)
+        self._log_error("CRC_MISMATCH", calc_crc.hex().upper(), recv_crc.hex().upper(), frame)
 
     def _retry_or_fail(self, timeout_ms: int, immediate: bool = False):
         """重试或失败，immediate=True 时先立即重发一次。"""
@@ -782,17 +990,15 @@ class FlashWorker(QObject):
                 self._transition_to(FlashState.FAILED)
                 return
             
-            retry_delay = self.init_retry_delay
+            retry_delay = self._next_retry_delay()
             if immediate:
                 self._emit_log(f"初始化重试，立即重发 (已用时:{elapsed_ms:.0f}ms)")
                 self._send_init_command(is_retry=True)
-                self.timeout_timer.start(retry_delay)  # 重启周期性定时器
+                self._arm_timer(retry_delay)  # 重启周期性定时器
             else:
                 self._emit_log(f"初始化重试，延迟{retry_delay}ms... (已用时:{elapsed_ms:.0f}ms)")
-                def retry_and_restart():
-                    self._send_init_command(is_retry=True)
-                    self.timeout_timer.start(retry_delay)
-                QTimer.singleShot(retry_delay, retry_and_restart)
+                # 到期后由 _on_timeout 重发并重启周期定时器
+                self._arm_timer(retry_delay)
             return
         
         # PROGRAM阶段：使用时间控制而非次数控制
@@ -809,20 +1015,18 @@ class FlashWorker(QObject):
                     return
                 # 常规重试：延迟后重新发送当前块
                 self._emit_log(f"延迟1000ms后重试数据块{self.current_block_index + 1}...")
-                QTimer.singleShot(1000, lambda: self._send_program_data(is_retry=False))  # 重置时间
+                self._arm_timer(1000, self._restart_program_block)  # 重置时间
                 return
             
-            retry_delay = self.program_retry_delay
+            retry_delay = self._next_retry_delay()
             if immediate:
                 self._emit_log(f"数据块{self.current_block_index + 1}重试，立即重发 (已用时:{elapsed_ms:.0f}ms)")
                 self._send_program_data(is_retry=True)
-                self.timeout_timer.start(retry_delay)  # 重启周期性定时器
+                self._arm_timer(retry_delay)  # 重启周期性定时器
             else:
                 self._emit_log(f"数据块{self.current_block_index + 1}重试，延迟{retry_delay}ms... (已用时:{elapsed_ms:.0f}ms)")
-                def retry_and_restart():
-                    self._send_program_data(is_retry=True)
-                    self.timeout_timer.start(retry_delay)
-                QTimer.singleShot(retry_delay, retry_and_restart)
+                # 到期后由 _on_timeout 重发并重启周期定时器
+                self._arm_timer(retry_delay)
             return
         
         # VERIFY阶段使用独立的重试计数
@@ -851,7 +1055,7 @@ class FlashWorker(QObject):
                 self._do_retry()
                 return
             self._emit_log(f"重试 ({current_retries}/{max_retries})，延迟{retry_delay}ms...")
-            QTimer.singleShot(retry_delay, self._do_retry)
+            self._arm_timer(retry_delay, self._do_retry)
         else:
             self._emit_log(f"重试次数超限 ({current_retries}/{max_retries})")
             self._transition_to(FlashState.FAILED)
@@ -868,8 +1072,40 @@ class FlashWorker(QObject):
         elif self.state == FlashState.WAIT_VERIFY:
             self._send_verify_command()
 
+    def _cfg_float(self, key: str, default: float) -> float:
+        """读取协议配置中的数值项，缺省或无法解析时返回默认值"""
+        try:
+            return float(self.cfg.get(key) or default)
+        except (TypeError, ValueError):
+            return default
+
+    def _next_retry_delay(self) -> int:
+        """返回本次重试间隔(ms)，并按倍率增大下一次的间隔（不超过上限）"""
+        delay = self._cur_delay
+        self._cur_delay = min(int(delay * self.retry_backoff), max(self.retry_delay_cap, delay))
+        return delay
+
+    def _arm_timer(self, delay_ms: int, action=None):
+        """启动唯一的 timeout_timer
+
+        action 为 None 时按超时处理，否则到期执行一次 action。每次启动都会覆盖
+        之前挂起的动作，保证任一时刻只有一个待触发的定时事件。
+        """
+        self._timer_action = action
+        self.timeout_timer.start(delay_ms)
+
+    def _restart_program_block(self):
+        """重新计时并发送当前数据块"""
+        self._send_program_data(is_retry=False)
+
     def _on_timeout(self):
         """超时处理"""
+        # 有挂起的延迟重试动作时优先执行
+        action = self._timer_action
+        if action is not None:
+            self._timer_action = None
+            action()
+            return
         # 初始化阶段：周期性重试触发
         if self.state == FlashState.WAIT_INIT:
             elapsed_ms = (time.time() - self.init_start_time) * 1000
@@ -879,7 +1115,7 @@ class FlashWorker(QObject):
             else:
                 # 重发并重启定时器
                 self._send_init_command(is_retry=True)
-                self.timeout_timer.start(self.init_retry_delay)
+                self._arm_timer(self._next_retry_delay())
         # PROGRAM阶段：周期性重试触发
         elif self.state == FlashState.WAIT_PROGRAM:
             elapsed_ms = (time.time() - self.program_start_time) * 1000
@@ -890,14 +1126,16 @@ class FlashWorker(QObject):
             else:
                 # 重发并重启定时器
                 self._send_program_data(is_retry=True)
-                self.timeout_timer.start(self.program_retry_delay)
+                self._arm_timer(self._next_retry_delay())
         else:
             self._emit_log(f"等待响应超时 (状态: {self.state.name})")
             self._retry_or_fail(500)
 
+    @Slot()
     def abort(self):
         """中止烧录"""
         self.timeout_timer.stop()
+        self._timer_action = None
         self.state = FlashState.FAILED
         self._emit_log("烧录已中止")
         self.sigCompleted.emit(False, "烧录已被用户中止")
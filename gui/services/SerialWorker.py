@@ -1,6 +1,25 @@
 from PySide6.QtCore import QObject, Signal
 import Usart_Para_FK as proto
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections import deque
+
+# _read_loop 接收解析状态
+_RX_IDLE = 0      # 等待帧起始
+_RX_ECHO = 1      # 跳过回显的TX帧，直到 ';'
+_RX_ECHO_CS = 2   # 跳过回显帧的校验字节
+_RX_PAYLOAD = 3   # 接收RX帧payload
+_RX_CS = 4        # 接收RX帧校验字节
+
+# 协议标记
+_SEMI = b';'
+_SEMI_BYTE = 0x3B
+_REPLY_PREFIX = b'#REPLY:'
+_EXIT_PAYLOAD = b'EXIT;'
+_HEX_REPLY_TAG = b'#HEX:REPLY'
+_HEX_REPLY_LEN = 13  # 固定长度：#HEX:REPLY(10) + CRC(2) + ;(1) = 13
+
+# 待界面取走的接收显示片段上限，超出时丢弃最旧的
+_RX_RING_LEN = 4096
 
 class SerialWorker(QObject):
     sigConnected = Signal(bool)
@@ -9,37 +28,83 @@ class SerialWorker(QObject):
     sigReadDone = Signal(dict)
     sigWriteDone = Signal(bool)
     sigError = Signal(str)
-    sigRawRecv = Signal(str)
-    sigAsciiRecv = Signal(str)
+    sigRxBatch = Signal()  # 接收显示队列由空变为非空，界面调用 takeRx 取走
     sigRawSend = Signal(str)
     sigAsciiSend = Signal(str)
     sigReadFailed = Signal()
     sigReplyOk = Signal(str, str)
     sigReplyMismatch = Signal(str)
-    sigRecvBreak = Signal()
 
     def __init__(self):
         super().__init__()
         self.port = None
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        self._reader = None  # 接收线程（常驻，连接期间一直运行 _read_loop）
         self.current_cfg = proto._read_protocol_cfg()
         self.ser = None
         self._reading = False
         self._last_tx_crc = None
         self._passthrough_mode = False  # 透传模式，用于固件烧录
+        # 接收线程 -> 界面的有界显示队列：元素为收到的字节片段，None 表示帧间隔
+        self._rx_ring = deque(maxlen=_RX_RING_LEN)
+        self._rx_dropped = 0  # 队列满时丢弃的片段数
+        self._rx_signalled = False  # 已发出 sigRxBatch、界面尚未取走
+        self._cfg_version = 0  # current_cfg 或缓存字段每次更新加一，接收线程据此重新取值
+        self._refresh_cfg_cache()
+
+    def _refresh_cfg_cache(self):
+        """从 current_cfg 取出收发帧用到的字段，收发时直接读属性，不再查配置字典"""
+        view = proto._cfg_view(self.current_cfg)
+        self._pre_bytes = view.pre_bytes
+        self._pre_len = len(view.pre_bytes)
+        self._cs_len = view.cs_len
+        self._cs_fn = view.cs_fn
+        self._tx_start = view.tx_start
+        self._tx_start_byte = view.tx_start.encode('latin1')
+        self._rx_start_byte = view.rx_start.encode('latin1')
+        # 读请求帧只取决于组名与协议配置，轮询时直接复用: group -> (帧, 帧HEX, ASCII内容, 帧CRC)
+        self._read_req_cache = {}
+        self._cfg_version += 1
+
+    def _push_rx(self, item):
+        """接收线程：放入一个显示片段；队列此前已通知过界面时不再重复发信号"""
+        ring = self._rx_ring
+        if len(ring) == ring.maxlen:
+            self._rx_dropped += 1
+        ring.append(item)
+        if not self._rx_signalled:
+            self._rx_signalled = True
+            self.sigRxBatch.emit()
+
+    def takeRx(self):
+        """界面线程：取走全部待显示的接收片段，返回 (片段列表, 丢弃的片段数)；片段为 None 表示帧间隔"""
+        # 先清标志再取：取走之后放入的片段会重新发信号
+        self._rx_signalled = False
+        ring = self._rx_ring
+        items = []
+        while ring:
+            items.append(ring.popleft())
+        dropped, self._rx_dropped = self._rx_dropped, 0
+        return items, dropped
 
     def shutdown(self):
-        try:
-            self.executor.shutdown(wait=False, cancel_futures=True)
-        except Exception:
-            pass
+        self._reading = False
+        self._join_reader()
+
+    def _join_reader(self):
+        """等待接收线程退出（读超时内会自行结束，这里不无限等待）"""
+        reader = self._reader
+        if reader is not None and reader is not threading.current_thread():
+            reader.join(timeout=0.5)
+        self._reader = None
 
     def connectPort(self, port: str):
         try:
+            self._refresh_cfg_cache()
             self.ser = proto._open_port(self.current_cfg, port)
             self.port = port
             self._reading = True
-            self.executor.submit(self._read_loop)
+            self._reader = threading.Thread(target=self._read_loop, name='serial-rx', daemon=True)
+            self._reader.start()
             self.sigConnected.emit(True)
         except Exception as e:
             self.sigConnected.emit(False)
@@ -52,6 +117,7 @@ class SerialWorker(QObject):
                 self.ser.close()
         except Exception:
             pass
+        self._join_reader()
         self.ser = None
         self.port = None
         self.sigConnected.emit(False)
@@ -60,18 +126,22 @@ class SerialWorker(QObject):
         if not self.port:
             self.sigError.emit('未连接串口')
             return
-        req = proto.build_read_request(group, self.current_cfg)
-        self.sigFrameSent.emit(req.hex())
-        self.sigRawSend.emit(req.hex())
-        pre = bytes.fromhex(self.current_cfg.get('Preamble','FC')) if self.current_cfg.get('Preamble','FC') else b''
-        algo = self.current_cfg.get('Checksum','CRC16_MODBUS').upper()
-        cs_len = 2 if algo=='CRC16_MODBUS' else (1 if algo=='SUM8' else 0)
-        ascii_payload = req[len(pre):len(req)-cs_len].decode('ascii') if len(req)>len(pre)+cs_len else ''
+        cached = self._read_req_cache.get(group)
+        if cached is None:
+            req = proto.build_read_request(group, self.current_cfg)
+            pre_len = self._pre_len
+            cs_len = self._cs_len
+            ascii_payload = req[pre_len:len(req)-cs_len].decode('ascii') if len(req)>pre_len+cs_len else ''
+            cached = (req, req.hex(), ascii_payload, req[-cs_len:] if cs_len else None)
+            self._read_req_cache[group] = cached
+        req, req_hex, ascii_payload, req_crc = cached
+        self.sigFrameSent.emit(req_hex)
+        self.sigRawSend.emit(req_hex)
         self.sigAsciiSend.emit(ascii_payload)
         try:
             if self.ser:
                 self.ser.write(req)
-                self._last_tx_crc = req[-cs_len:] if cs_len else None
+                self._last_tx_crc = req_crc
         except Exception as e:
             self.sigError.emit(str(e))
 
@@ -82,10 +152,9 @@ class SerialWorker(QObject):
         frame = proto.build_frame(group, values, self.current_cfg)
         self.sigFrameSent.emit(frame.hex())
         self.sigRawSend.emit(frame.hex())
-        pre = bytes.fromhex(self.current_cfg.get('Preamble','FC')) if self.current_cfg.get('Preamble','FC') else b''
-        algo = self.current_cfg.get('Checksum','CRC16_MODBUS').upper()
-        cs_len = 2 if algo=='CRC16_MODBUS' else (1 if algo=='SUM8' else 0)
-        ascii_payload = frame[len(pre):len(frame)-cs_len].decode('ascii') if len(frame)>len(pre)+cs_len else ''
+        pre_len = self._pre_len
+        cs_len = self._cs_len
+        ascii_payload = frame[pre_len:len(frame)-cs_len].decode('ascii') if len(frame)>pre_len+cs_len else ''
         self.sigAsciiSend.emit(ascii_payload)
         try:
             if self.ser:
@@ -96,7 +165,11 @@ class SerialWorker(QObject):
             self.sigError.emit(str(e))
 
     def setBaudRate(self, baud: int):
-        self.current_cfg['Baud'] = str(baud)
+        # 整体替换配置字典而不原地修改，接收线程手里的旧字典始终完整一致
+        cfg = dict(self.current_cfg)
+        cfg['Baud'] = str(baud)
+        self.current_cfg = cfg
+        self._cfg_version += 1
 
     def setPassthroughMode(self, enabled: bool):
         """设置透传模式（固件烧录时使用）"""
@@ -107,13 +180,10 @@ class SerialWorker(QObject):
             self.sigError.emit('未连接串口')
             return
         try:
-            cfg = self.current_cfg
-            tx_start = (cfg.get('TxStart','!') or '!')[0]
-            algo = cfg.get('Checksum','CRC16_MODBUS').upper()
-            pre_bytes = bytes.fromhex(cfg.get('Preamble','')) if cfg.get('Preamble','') else b''
-            payload = bytes([ord(tx_start)]) + b'EXIT;'
-            cs = proto._checksum_bytes(payload, algo)
-            frame = pre_bytes + payload + cs
+            tx_start = self._tx_start
+            payload = self._tx_start_byte + _EXIT_PAYLOAD
+            cs = self._cs_fn(payload)
+            frame = b''.join((self._pre_bytes, payload, cs))
             self.sigFrameSent.emit(frame.hex())
             self.sigRawSend.emit(frame.hex())
             try:
@@ -128,23 +198,50 @@ class SerialWorker(QObject):
 
     def _read_loop(self):
         try:
-            cfg = self.current_cfg
-            pre = bytes.fromhex(cfg.get('Preamble','FC')) if cfg.get('Preamble','FC') else b''
-            algo = cfg.get('Checksum','CRC16_MODBUS').upper()
-            
-            tx_start_char = (cfg.get('TxStart','!') or '!')[0]
-            tx_start_byte = tx_start_char.encode('latin1')
-            
-            rx_start_char = (cfg.get('RxStart','#') or '#')[0]
-            rx_start_byte = rx_start_char.encode('latin1')
-            
-            cs_len = 2 if algo=='CRC16_MODBUS' else (1 if algo=='SUM8' else 0)
-            pre_len = len(pre)
-            recent = bytearray()
+            cfg_version = None
+            # 上一块末尾的空闲字节（最多 pre_len 个），用于判断跨块的前导
+            recent = b''
+            has_pre = False  # 当前RX帧起始符前是否紧跟前导
+
+            state = _RX_IDLE
+            # RX帧payload写入预分配缓冲区，pos 为已收长度；超过单帧上限仍无结束符则丢弃
+            max_frame = proto._MAX_FRAME_LEN
+            buf = bytearray(max_frame)
+            pos = 0
+            cs = bytearray()
+            fixed_len = None  # #HEX:REPLY 帧的固定payload长度
+            skip = 0  # 回显帧还需跳过的校验字节数
+            shown = bytearray()  # 本次读到、需要显示的字节，按块合并放入显示队列
+            push_rx = self._push_rx
+
+            def flush_shown():
+                if shown:
+                    push_rx(bytes(shown))
+                    shown.clear()
+
+            def finish_frame():
+                flush_shown()
+                push_rx(None)
+                payload = bytes(buf[:pos])
+                frame = b''.join((pre if has_pre else b'', payload, cs))
+                self.sigFrameRecv.emit(frame.hex())
+                # 透传模式与 #HEX:REPLY 帧只转发，不解析
+                if not self._passthrough_mode and fixed_len is None:
+                    self._handle_rx_frame(frame, payload, bytes(cs))
             
+            ser = self.ser
             while self._reading and self.ser:
+                if cfg_version != self._cfg_version:
+                    # 配置被替换时重新取一次；只在每次读之前比较版本号，接收路径不加锁
+                    cfg_version = self._cfg_version
+                    pre = self._pre_bytes
+                    pre_len = self._pre_len
+                    tx_start_byte = self._tx_start_byte
+                    rx_start_byte = self._rx_start_byte
+                    cs_len = self._cs_len
                 try:
-                    b = self.ser.read(1)
+                    # 一次取走缓冲区内全部数据；缓冲区为空时阻塞等待1字节（受串口超时限制）
+                    chunk = ser.read(ser.in_waiting or 1)
                 except Exception as e:
                     # 读异常通常意味着串口被拔掉或不可用
                     try:
@@ -165,187 +262,168 @@ class SerialWorker(QObject):
                         pass
                     break
 
-                if not b:
-                    # 超时无数据，继续等待（不视为断开）
-                    continue
-                
-                # Filter echoed TX frames (starting with !)
-                if b == tx_start_byte:
-                    # Consume until ; + CRC
-                    # Do NOT emit signals for these bytes
-                    while self._reading and self.ser:
-                        c = self.ser.read(1)
-                        if not c:
-                            break
-                        if c == b';':
-                            if cs_len:
-                                # 阻塞读取完整的cs_len字节（过滤回显的TX帧）
-                                bytes_to_read = cs_len
-                                while bytes_to_read > 0 and self._reading and self.ser:
-                                    chunk = self.ser.read(bytes_to_read)
-                                    if not chunk:
-                                        break
-                                    bytes_to_read -= len(chunk)
-                            break
+                if not chunk:
+                    # 超时无数据，继续等待（不视为断开）；未收完的帧：校验字节不全时按已收到的处理，其余丢弃
+                    if state == _RX_CS:
+                        finish_frame()
+                    state = _RX_IDLE
                     continue
 
-                # Handle RX frames (starting with #) or other data
-                try:
-                    self.sigRawRecv.emit(b.hex())
-                    self.sigAsciiRecv.emit(b.decode('latin1'))
-                except Exception:
-                    pass
-                
-                recent += b
-                if pre_len and len(recent) > pre_len:
-                    recent = recent[-pre_len:]
-                
-                if b == rx_start_byte:
-                    payload = bytearray(b)
-                    target_payload_len = None
-                    
-                    while self._reading and self.ser:
-                        c = self.ser.read(1)
-                        if not c:
-                            break
-                        try:
-                            self.sigRawRecv.emit(c.hex())
-                            self.sigAsciiRecv.emit(c.decode('latin1'))
-                        except Exception:
-                            pass
-                        payload += c
-
-                        # 如果是 #HEX:REPLY 开头的帧，采用固定长度解析
-                        if payload.startswith(b'#HEX:REPLY') and target_payload_len is None:
-                            target_payload_len = 13  # 固定长度：#HEX:REPLY(10) + CRC(2) + ;(1) = 13
-
-                        # 非REPLY帧：按分号结束
-                        if target_payload_len is None and c == b';':
-                            cs = b''
+                i = 0
+                n = len(chunk)
+                while i < n:
+                    if state == _RX_IDLE:
+                        # 找下一个帧起始：回显的TX帧（以 ! 开头）或RX帧（以 # 开头）
+                        t = chunk.find(tx_start_byte, i)
+                        r = chunk.find(rx_start_byte, i)
+                        if t < 0:
+                            t = n
+                        if r < 0:
+                            r = n
+                        if t <= r and t < n:
+                            # 回显帧本身不显示
+                            seg = chunk[i:t]
+                            recent = b''
+                            state = _RX_ECHO
+                        elif r < n:
+                            # 帧起始符前紧邻的 pre_len 个字节是否为前导；够长时直接在本块内比较
+                            if not pre_len:
+                                has_pre = False
+                            elif r - i >= pre_len:
+                                has_pre = chunk.startswith(pre, r - pre_len)
+                            else:
+                                has_pre = (recent + chunk[i:r]).endswith(pre)
+                            recent = b''
+                            seg = chunk[i:r + 1]
+                            buf[0] = rx_start_byte[0]
+                            pos = 1
+                            fixed_len = None
+                            state = _RX_PAYLOAD
+                        else:
+                            seg = chunk[i:]
+                            if pre_len:
+                                recent = (recent + seg[-pre_len:])[-pre_len:]
+                        shown += seg
+                        i = min(t, r) + 1
+                    elif state == _RX_ECHO:
+                        # Consume until ; + CRC, do NOT emit signals for these bytes
+                        k = chunk.find(_SEMI, i)
+                        if k < 0:
+                            i = n
+                        else:
+                            i = k + 1
+                            skip = cs_len
+                            state = _RX_ECHO_CS if skip else _RX_IDLE
+                    elif state == _RX_ECHO_CS:
+                        take = min(skip, n - i)
+                        i += take
+                        skip -= take
+                        if not skip:
+                            state = _RX_IDLE
+                    elif state == _RX_PAYLOAD:
+                        if fixed_len is None:
+                            # 非REPLY帧：按分号结束；收满标记长度前先截断，以便识别 #HEX:REPLY
+                            end = chunk.find(_SEMI, i) + 1 or n
+                            cut = i + len(_HEX_REPLY_TAG) - pos
+                            if i < cut < end:
+                                end = cut
+                        else:
+                            # REPLY帧：按固定长度收满payload
+                            end = min(n, i + fixed_len - pos)
+                        seg = chunk[i:end]
+                        shown += seg
+                        i = end
+                        if pos + len(seg) > max_frame:
+                            state = _RX_IDLE
+                            continue
+                        buf[pos:pos + len(seg)] = seg
+                        pos += len(seg)
+                        if fixed_len is None and pos >= len(_HEX_REPLY_TAG) and buf.startswith(_HEX_REPLY_TAG):
+                            fixed_len = _HEX_REPLY_LEN
+                        if (pos >= fixed_len) if fixed_len is not None else buf[pos - 1] == _SEMI_BYTE:
+                            cs = bytearray()
                             if cs_len:
-                                bytes_to_read = cs_len
-                                while bytes_to_read > 0 and self._reading and self.ser:
-                                    chunk = self.ser.read(bytes_to_read)
-                                    if not chunk:
-                                        break
-                                    cs += chunk
-                                    bytes_to_read -= len(chunk)
-                            
-                            # 发送信号
-                            try:
-                                self.sigRawRecv.emit(cs.hex())
-                                self.sigAsciiRecv.emit(cs.decode('latin1'))
-                            except Exception:
-                                pass
-                            self.sigRecvBreak.emit()
-                            
-                            frame = (pre if pre_len and recent == pre else b'') + bytes(payload) + cs
-                            try:
-                                self.sigFrameRecv.emit(frame.hex())
-                            except Exception:
-                                pass
-                            
-                            if self._passthrough_mode:
-                                break
-                            
-                            # 处理 #REPLY: 响应
-                            pl = bytes(payload)
-                            if pl.startswith(b'#REPLY:') and pl.endswith(b';'):
-                                data_region = pl[len(b'#REPLY:'):-1]
-                                dr = data_region
-                                try:
-                                    text = dr.decode('ascii')
-                                    s = text.replace(' ', '').upper()
-                                    if len(s) % 2 == 0 and all(ch in '0123456789ABCDEF' for ch in s):
-                                        dr = bytes(int(s[i:i+2], 16) for i in range(0, len(s), 2))
-                                except Exception:
-                                    pass
-                                
-                                calc_reply_cs = proto._checksum_bytes(pl, algo)
-                                reply_crc_hex = ' '.join(f'{b:02X}' for b in (cs or b''))
-                                if cs_len and cs != calc_reply_cs:
-                                    try:
-                                        self.sigReplyMismatch.emit(f'回复帧CRC校验失败 (Exp:{calc_reply_cs.hex().upper()}, Got:{cs.hex().upper()})')
-                                    except Exception:
-                                        pass
-                                else:
-                                    sent_crc_hex = ' '.join(f'{b:02X}' for b in (dr or b''))
-                                    if self._last_tx_crc and dr != self._last_tx_crc:
-                                        msg = f'回复携带的上位机CRC不匹配 (Exp:{self._last_tx_crc.hex().upper()}, Got:{dr.hex().upper()})'
-                                        try:
-                                            self.sigReplyMismatch.emit(msg)
-                                        except Exception:
-                                            pass
-                                    else:
-                                        try:
-                                            self.sigReplyOk.emit(sent_crc_hex, reply_crc_hex)
-                                        except Exception:
-                                            pass
-                            
-                            # 解析帧
-                            try:
-                                parsed = proto.parse_frame(frame, cfg)
-                                if parsed:
-                                    try:
-                                        self.sigReadDone.emit(parsed)
-                                    except Exception:
-                                        pass
-                                    # 自动回复
-                                    try:
-                                        tx_start = (cfg.get('TxStart','!') or '!')[0]
-                                        algo = cfg.get('Checksum','CRC16_MODBUS').upper()
-                                        pre_bytes = bytes.fromhex(cfg.get('Preamble','')) if cfg.get('Preamble','') else b''
-                                        recv_crc_hex = ' '.join([f'{b:02X}' for b in cs]) if cs_len else ''
-                                        payload_bytes = bytes([ord(tx_start)]) + b'REPLY:' + (cs if cs_len else b'') + b';'
-                                        reply_cs = proto._checksum_bytes(payload_bytes, algo)
-                                        reply_frame = pre_bytes + payload_bytes + reply_cs
-                                        self.sigFrameSent.emit(reply_frame.hex())
-                                        self.sigRawSend.emit(reply_frame.hex())
-                                        self.sigAsciiSend.emit(f"!REPLY:{recv_crc_hex};")
-                                        if self.ser:
-                                            self.ser.write(reply_frame)
-                                    except Exception:
-                                        pass
-                                else:
-                                    try:
-                                        self.sigReadFailed.emit()
-                                        self.sigError.emit('接收校验失败')
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
-                            break
-                        
-                        # REPLY帧：按固定长度收满payload后退出
-                        if target_payload_len is not None and len(payload) >= target_payload_len:
-                            cs = b''
-                            if cs_len:
-                                bytes_to_read = cs_len
-                                while bytes_to_read > 0 and self._reading and self.ser:
-                                    chunk = self.ser.read(bytes_to_read)
-                                    if not chunk:
-                                        break
-                                    cs += chunk
-                                    bytes_to_read -= len(chunk)
-                            
-                            try:
-                                self.sigRawRecv.emit(cs.hex())
-                                self.sigAsciiRecv.emit(cs.decode('latin1'))
-                            except Exception:
-                                pass
-                            self.sigRecvBreak.emit()
-                            
-                            frame = (pre if pre_len and recent == pre else b'') + bytes(payload) + cs
-                            try:
-                                self.sigFrameRecv.emit(frame.hex())
-                            except Exception:
-                                pass
-                            
-                            if self._passthrough_mode:
-                                break
-                            break
+                                state = _RX_CS
+                            else:
+                                state = _RX_IDLE
+                                finish_frame()
+                    else:  # _RX_CS
+                        take = min(cs_len - len(cs), n - i)
+                        seg = chunk[i:i + take]
+                        cs += seg
+                        shown += seg
+                        i += take
+                        if len(cs) >= cs_len:
+                            state = _RX_IDLE
+                            finish_frame()
+
+                flush_shown()
         except Exception as e:
             try:
                 self.sigError.emit(str(e))
             except Exception:
                 pass
+
+    def _handle_rx_frame(self, frame: bytes, pl: bytes, cs: bytes):
+        """处理一帧完整的RX帧：#REPLY: 回复校验、解析参数并自动回复"""
+        cs_fn = self._cs_fn
+        cs_len = self._cs_len
+        # 本帧校验只算一次，#REPLY 校验与参数解析共用
+        calc_cs = cs_fn(pl)
+        # 处理 #REPLY: 响应
+        if pl.startswith(_REPLY_PREFIX) and pl.endswith(_SEMI):
+            data_region = pl[len(_REPLY_PREFIX):-1]
+            dr = data_region
+            # 回复内容为ASCII十六进制时转为原始字节；非十六进制（含非ASCII）保持原样
+            try:
+                dr = bytes.fromhex(dr.decode('ascii').replace(' ', ''))
+            except ValueError:
+                pass
+            
+            reply_crc_hex = cs.hex(' ').upper()
+            if cs_len and cs != calc_cs:
+                try:
+                    self.sigReplyMismatch.emit(f'回复帧CRC校验失败 (Exp:{calc_cs.hex().upper()}, Got:{cs.hex().upper()})')
+                except Exception:
+                    pass
+            else:
+                sent_crc_hex = dr.hex(' ').upper()
+                if self._last_tx_crc and dr != self._last_tx_crc:
+                    msg = f'回复携带的上位机CRC不匹配 (Exp:{self._last_tx_crc.hex().upper()}, Got:{dr.hex().upper()})'
+                    try:
+                        self.sigReplyMismatch.emit(msg)
+                    except Exception:
+                        pass
+                else:
+                    try:
+                        self.sigReplyOk.emit(sent_crc_hex, reply_crc_hex)
+                    except Exception:
+                        pass
+        
+        # 解析帧（等同 proto.parse_frame：需带完整前导与校验，且校验正确）
+        try:
+            framed = len(frame) == self._pre_len + len(pl) + cs_len
+            parsed = proto._parse_payload(pl) if framed and cs == calc_cs else {}
+            if parsed:
+                self.sigReadDone.emit(parsed)
+                # 自动回复
+                try:
+                    recv_crc_hex = cs.hex(' ').upper() if cs_len else ''
+                    payload_bytes = self._tx_start_byte + b'REPLY:' + (cs if cs_len else b'') + _SEMI
+                    reply_cs = cs_fn(payload_bytes)
+                    reply_frame = b''.join((self._pre_bytes, payload_bytes, reply_cs))
+                    self.sigFrameSent.emit(reply_frame.hex())
+                    self.sigRawSend.emit(reply_frame.hex())
+                    self.sigAsciiSend.emit(f"!REPLY:{recv_crc_hex};")
+                    if self.ser:
+                        self.ser.write(reply_frame)
+                except Exception:
+                    pass
+            else:
+                try:
+                    self.sigReadFailed.emit()
+                    self.sigError.emit('接收校验失败')
+                except Exception:
+                    pass
+        except Exception:
+            pass
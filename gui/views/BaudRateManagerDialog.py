@@ -7,7 +7,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QIntValidator
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QLineEdit, QMessageBox, QGroupBox
+    QListWidget, QListWidgetItem, QLineEdit, QMessageBox, QGroupBox
 )
 
 
@@ -82,23 +82,49 @@ class BaudRateManagerDialog(QDialog):
         self.baud_list.itemSelectionChanged.connect(self._on_selection_changed)
     
     def _load_baud_rates(self):
-        """Load baud rate list"""
-        self.baud_list.clear()
+        """Load baud rate list, updating existing items in place"""
         baud_rates = self.config_manager.get_baud_rates()
         default_baud = self.config_manager.get_default_baud_rate()
         
-        for baud in baud_rates:
-            is_custom = self.config_manager.is_custom_baud_rate(baud)
-            is_default = (baud == default_baud)
-            
-            # Build display text
-            text = f"{baud}"
-            if is_default:
-                text += " [Default]"
-            if is_custom:
-                text += " [Custom]"
+        # Both the list and baud_rates are sorted, so merge them row by row
+        # instead of clearing and rebuilding every item (keeps the selection)
+        self.baud_list.setUpdatesEnabled(False)
+        self.baud_list.blockSignals(True)
+        try:
+            row = 0
+            for baud in baud_rates:
+                is_custom = self.config_manager.is_custom_baud_rate(baud)
+                is_default = (baud == default_baud)
+                
+                # Build display text
+                text = f"{baud}"
+                if is_default:
+                    text += " [Default]"
+                if is_custom:
+                    text += " [Custom]"
+                # Keep the logical state on the item so selection handlers don't parse the text
+                data = {'baud': baud, 'is_custom': is_custom, 'is_default': is_default}
+                
+                # Drop rows whose baud rate has been removed
+                while row < self.baud_list.count() and self.baud_list.item(row).data(Qt.UserRole)['baud'] < baud:
+                    self.baud_list.takeItem(row)
+                
+                item = self.baud_list.item(row)
+                if item is not None and item.data(Qt.UserRole)['baud'] == baud:
+                    if item.text() != text:
+                        item.setText(text)
+                    item.setData(Qt.UserRole, data)
+                else:
+                    item = QListWidgetItem(text)
+                    item.setData(Qt.UserRole, data)
+                    self.baud_list.insertItem(row, item)
+                row += 1
             
-            self.baud_list.addItem(text)
+            while self.baud_list.count() > row:
+                self.baud_list.takeItem(row)
+        finally:
+            self.baud_list.blockSignals(False)
+            self.baud_list.setUpdatesEnabled(True)
         
         self._on_selection_changed()
     
@@ -110,8 +136,8 @@ class BaudRateManagerDialog(QDialog):
         # Only custom baud rates can be deleted
         can_delete = False
         if has_selection:
-            selected_text = self.baud_list.selectedItems()[0].text()
-            can_delete = "[Custom]" in selected_text
+            data = self.baud_list.selectedItems()[0].data(Qt.UserRole)
+            can_delete = bool(data and data['is_custom'])
         
         self.btn_delete.setEnabled(can_delete)
     
@@ -120,13 +146,8 @@ class BaudRateManagerDialog(QDialog):
         if not self.baud_list.selectedItems():
             return None
         
-        text = self.baud_list.selectedItems()[0].text()
-        # Extract numeric part
-        try:
-            baud_str = text.split()[0]
-            return int(baud_str)
-        except:
-            return None
+        data = self.baud_list.selectedItems()[0].data(Qt.UserRole)
+        return data['baud'] if data else None
     
     def _on_add_clicked(self):
         """Add button clicked"""
@@ -2,15 +2,19 @@
 固件烧录标签页
 支持拖拽HEX文件并烧录到下位机
 """
-from PySide6.QtCore import Qt, QMimeData
+from PySide6.QtCore import Qt, QMimeData, QObject, QThread, QTimer, Signal, Slot
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QProgressBar, QTextEdit, QFrame, QGroupBox, QMessageBox, QComboBox, QDockWidget, QMainWindow, QCheckBox, QSplitter
 )
-from PySide6.QtGui import QFontDatabase
+from PySide6.QtGui import QFont, QFontDatabase, QTextCharFormat, QTextCursor, QColor
 import os
+import re
 import sys
+import time
+from collections import deque
+from itertools import islice
 from gui.services.FlashWorker import FlashWorker, FlashState
 from hex_parser import HexParser
 
@@ -22,6 +26,34 @@ try:
 except (ImportError, ModuleNotFoundError):
     ENABLE_LOGGING = True
 
+# 发送/接收日志各保留的最近帧数
+LOG_MAX_FRAMES = 2048
+# 日志视图的文本块上限（完整HEX下一帧约占 2 + 行数 个块）
+LOG_MAX_BLOCKS = 40000
+# 帧日志视图的刷新间隔(ms)，期间到达的帧合并为一次刷新
+LOG_REFRESH_MS = 80
+
+# 帧中 START 命令后的 8 位十六进制地址
+_START_KEY = b"HEX:START"
+_HEX8_RE = re.compile(rb"[0-9A-Fa-f]{8}")
+
+# 字节 -> 可打印字符的转换表，不可打印字节替换为 '.'
+_PRINT_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
+# 时间戳缓存 (秒, "HH:MM:SS")，界面线程和格式化线程共用；整体替换元组，读到的两项总是一致
+_ts_cache = (-1, "")
+
+
+def _timestamp() -> str:
+    """当前时间 HH:MM:SS，每秒只格式化一次。"""
+    global _ts_cache
+    sec = int(time.time())
+    cached_sec, text = _ts_cache
+    if sec != cached_sec:
+        text = time.strftime("%H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, text)
+    return text
+
 
 class DropArea(QFrame):
     """拖拽区域"""
@@ -78,8 +110,45 @@ class DropArea(QFrame):
         self.label.setText("拖入HEX文件到此处\n或点击选择文件")
 
 
+class FrameLogFormatter(QObject):
+    """帧日志格式化，运行在独立线程，把帧HEX整理为完整HEX日志条目"""
+    # 帧HEX, 时间戳, 头部文本, dump文本, 数据行数
+    sigFormattedSent = Signal(str, str, str, str, int)
+    sigFormattedRecv = Signal(str, str, str, str, int)
+
+    @Slot(str)
+    def format_sent(self, hex_str: str):
+        self.sigFormattedSent.emit(hex_str, *self._format(hex_str, 'TX'))
+
+    @Slot(str)
+    def format_recv(self, hex_str: str):
+        self.sigFormattedRecv.emit(hex_str, *self._format(hex_str, 'RX'))
+
+    def _format(self, hex_str: str, tag: str):
+        timestamp = _timestamp()
+
+        # 只解码一次，后续格式化复用
+        try:
+            data = bytes.fromhex(hex_str)
+        except Exception:
+            data = None
+        data_len = len(data) if data is not None else 0
+
+        # HEX格式（分行dump + CRC展示）
+        base = FlashTab._guess_base_address(hex_str, data=data)
+        dump = FlashTab._hex_dump(hex_str, base_address=base, data=data)
+        rows = (data_len + 15) // 16 if data is not None else 0
+        return timestamp, f"[{timestamp}] {tag} len={data_len}B", dump, rows
+
+
 class FlashTab(QWidget):
     """固件烧录标签页"""
+    # 发往烧录线程的请求（跨线程自动排队执行）
+    sigStartFlash = Signal(object, str, bool)
+    sigFrameToFlash = Signal(bytes)
+    sigAbortFlash = Signal()
+    sigStepFlash = Signal()
+
     def __init__(self, parent=None, config_manager=None):
         super().__init__(parent)
         self.main_window = parent if isinstance(parent, QMainWindow) else None
@@ -87,6 +156,9 @@ class FlashTab(QWidget):
         self.serial_port = None
         self.serial_worker = None  # 串口worker引用
         self.flash_worker = None
+        self.flash_thread = None  # 烧录线程，串口写入与重试定时器都在此线程执行
+        self._direct_rx = False  # 串口线程是否直接向烧录线程投递帧
+        self._logging_on = ENABLE_LOGGING  # 日志开关的缓存值，供烧录线程读取
         self.hex_file_path = None
         self.is_flashing = False
         self.debug_mode = False
@@ -94,51 +166,93 @@ class FlashTab(QWidget):
         self.addr_color = "#F75BC6"  # 247,91,198
         self.hex_color = "#41FF41"   # 65,255,65
         self.ascii_color = "#FFB000" # 255,176,0
+        # 完整HEX视图的字符格式：头部、地址、HEX、ASCII、统计信息、分隔符
+        self._fmt_head = self._char_format("#CCC")
+        self._fmt_addr = self._char_format(self.addr_color)
+        self._fmt_hex = self._char_format(self.hex_color)
+        self._fmt_ascii = self._char_format(self.ascii_color)
+        self._fmt_meta = self._char_format("#999")
+        self._fmt_plain = QTextCharFormat()
+        # 状态日志中校验结果的字符格式
+        self._fmt_err_title = self._char_format("red", bold=True)
+        self._fmt_warn_title = self._char_format("orange", bold=True)
+        self._fmt_ok_title = self._char_format("green", bold=True)
+        self._fmt_expected = self._char_format("blue")
+        self._fmt_actual = self._char_format("red")
+        self._fmt_ok = self._char_format("green")
+        # 列视图：列名 -> (颜色 span 前缀, _hex_dump return_parts 中的下标)
+        self._column_spans = {
+            '地址列': (f'<span style="color:{self.addr_color};">', 1),
+            'HEX列': (f'<span style="color:{self.hex_color};">', 2),
+            'ASCII列': (f'<span style="color:{self.ascii_color};">', 3),
+        }
 
         self._init_ui()
 
+        # 帧日志格式化线程，随标签页常驻
+        self.log_formatter = FrameLogFormatter()
+        self.log_formatter.sigFormattedSent.connect(self.on_frame_sent)
+        self.log_formatter.sigFormattedRecv.connect(self.on_frame_recv)
+        self.log_thread = QThread()
+        self.log_formatter.moveToThread(self.log_thread)
+        self.log_thread.start()
+        # 标签页不经 MainWindow.closeEvent 销毁时也要结束线程，否则 Qt 会因线程仍在运行而中止
+        self.destroyed.connect(lambda *_, t=self.log_thread: FlashTab._stop_thread(t))
+
     # ---------------- 日志格式化工具 ----------------
     @staticmethod
-    def _hex_dump(hex_str: str, width: int = 16, base_address: int | None = None, return_parts: bool = False, html_color: bool = False, addr_color: str | None = None, hex_color: str | None = None, ascii_color: str | None = None):
+    def _hex_dump(hex_str: str, width: int = 16, base_address: int | None = None, return_parts: bool = False, html_color: bool = False, addr_color: str | None = None, hex_color: str | None = None, ascii_color: str | None = None, data: bytes | None = None):
         """HEX字符串美观输出: 十六进制+ASCII，全量显示不截断。
 
         base_address: 如果提供，地址列显示为绝对地址 (0xXXXXXXXX)，否则为偏移 0000.
         return_parts: 为 True 时返回 (整体文本, 地址列, HEX列, ASCII列)。
         html_color: 为 True 时返回HTML格式彩色文本。
+        data: 已解码的字节，提供时不再解析 hex_str。
         """
-        try:
-            data = bytes.fromhex(hex_str)
-        except Exception:
-            return ("[格式错误]", "", "", "") if return_parts else "[格式错误]"
+        if data is None:
+            try:
+                data = bytes.fromhex(hex_str)
+            except Exception:
+                return ("[格式错误]", "", "", "") if return_parts else "[格式错误]"
 
         total = len(data)
         lines = []
-        addr_lines = []
-        hex_lines = []
-        ascii_lines = []
+        # 列数据只在 return_parts 时收集
+        addr_lines = [] if return_parts else None
+        hex_lines = [] if return_parts else None
+        ascii_lines = [] if return_parts else None
+        # 整帧一次性转换，逐行只做切片
+        hex_all = data.hex(' ').upper()
+        ascii_all = data.translate(_PRINT_TABLE).decode('ascii')
         base = base_address if base_address is not None else 0
         
         # 颜色定义：地址、HEX、ASCII（可外部传入）
         addr_color = addr_color or "#4A90E2"
         hex_color = hex_color or "#50C878"
         ascii_color = ascii_color or "#FF8C42"
+        hex_width = width * 3 - 1
+        if html_color:
+            # 每次调用只拼一次 span 前缀，逐行直接连接
+            addr_pre = f'<span style="color:{addr_color};">'
+            hex_pre = f'</span>: <span style="color:{hex_color};">'
+            ascii_pre = f'</span> |<span style="color:{ascii_color};">'
         
         for i in range(0, total, width):
-            chunk = data[i:i + width]
-            hex_part = ' '.join(f"{b:02X}" for b in chunk)
-            ascii_part = ''.join(chr(b) if 32 <= b < 127 else '.' for b in chunk)
+            end = min(i + width, total)
+            hex_part = hex_all[i * 3:end * 3 - 1]
+            ascii_part = ascii_all[i:end]
             addr_val = base + i
             addr_str = f"0x{addr_val:08X}" if base_address is not None else f"{i:04X}"
             
             if html_color:
-                line = f'<span style="color:{addr_color};">{addr_str}</span>: <span style="color:{hex_color};">{hex_part:<{width * 3 - 1}}</span> |<span style="color:{ascii_color};">{ascii_part}</span>|'
-                lines.append(line)
+                lines.append(addr_pre + addr_str + hex_pre + hex_part.ljust(hex_width) + ascii_pre + ascii_part + '</span>|')
             else:
-                lines.append(f"{addr_str}: {hex_part:<{width * 3 - 1}} |{ascii_part}|")
+                lines.append(f"{addr_str}: {hex_part:<{hex_width}} |{ascii_part}|")
             
-            addr_lines.append(addr_str)
-            hex_lines.append(hex_part)
-            ascii_lines.append(ascii_part)
+            if return_parts:
+                addr_lines.append(addr_str)
+                hex_lines.append(hex_part)
+                ascii_lines.append(ascii_part)
 
         # 根据 ENABLE_LOGGING 决定是否输出总长度和CRC信息
         if ENABLE_LOGGING:
@@ -158,14 +272,15 @@ class FlashTab(QWidget):
         return '\n'.join(lines)
 
     @staticmethod
-    def _ascii_preview(hex_str: str) -> str:
+    def _ascii_preview(hex_str: str = '', data: bytes | None = None) -> str:
         """ASCII预览：不可打印替换为.，不截断。"""
-        try:
-            data = bytes.fromhex(hex_str)
-        except Exception:
-            return "[格式错误]"
+        if data is None:
+            try:
+                data = bytes.fromhex(hex_str)
+            except Exception:
+                return "[格式错误]"
 
-        return ''.join(chr(b) if 32 <= b < 127 else '.' for b in data)
+        return data.translate(_PRINT_TABLE).decode('ascii')
 
     def _init_dock_logs(self, show_immediately: bool = False):
         """保留接口以兼容旧逻辑，但当前使用内嵌日志，不再创建Dock。"""
@@ -291,6 +406,12 @@ class FlashTab(QWidget):
         self.send_log_view.setReadOnly(True)
         self.recv_log_view = QTextEdit()
         self.recv_log_view.setReadOnly(True)
+        # 帧日志通过 QTextCursor 追加，关闭撤销栈避免记录每次插入
+        self.send_log_view.setUndoRedoEnabled(False)
+        self.recv_log_view.setUndoRedoEnabled(False)
+        # 视图与缓存同步限长，超出后自动丢弃最早的内容
+        self.send_log_view.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.recv_log_view.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.status_log_view = QTextEdit()
         self.status_log_view.setReadOnly(True)
         self._apply_monospace(self.send_log_view)
@@ -335,12 +456,30 @@ class FlashTab(QWidget):
         main_layout.addWidget(self.log_group, 3)
 
         # 缓存日志数据
-        self.send_logs_ascii = []
-        self.send_logs_hex = []
-        self.recv_logs_ascii = []
-        self.recv_logs_hex = []
-        self.send_raw_frames = []  # 仅存储HEX字符串原文
-        self.recv_raw_frames = []
+        self.send_logs_ascii = deque(maxlen=LOG_MAX_FRAMES)
+        self.send_logs_hex = deque(maxlen=LOG_MAX_FRAMES)
+        self.recv_logs_ascii = deque(maxlen=LOG_MAX_FRAMES)
+        self.recv_logs_hex = deque(maxlen=LOG_MAX_FRAMES)
+        self.send_raw_frames = deque(maxlen=LOG_MAX_FRAMES)  # 仅存储HEX字符串原文
+        self.recv_raw_frames = deque(maxlen=LOG_MAX_FRAMES)
+        # 与 raw_frames 一一对应的时间戳；ASCII预览在切换到该格式时才补齐
+        self.send_frame_times = deque(maxlen=LOG_MAX_FRAMES)
+        self.recv_frame_times = deque(maxlen=LOG_MAX_FRAMES)
+        # 累计帧序号；缓存限长后用序号而不是长度判断增量
+        self._send_seq = 0
+        self._recv_seq = 0
+        # 完整HEX视图 / ASCII预览已处理到的帧序号
+        self._send_rendered = 0
+        self._recv_rendered = 0
+        self._send_ascii_seq = 0
+        self._recv_ascii_seq = 0
+        # 新帧只标记待刷新，由定时器合并更新视图
+        self._send_dirty = False
+        self._recv_dirty = False
+        self._log_refresh_timer = QTimer(self)
+        self._log_refresh_timer.setSingleShot(True)
+        self._log_refresh_timer.setInterval(LOG_REFRESH_MS)
+        self._log_refresh_timer.timeout.connect(self._flush_frame_logs)
 
     def _wrap_log_panel(self, title: str, widget: QWidget) -> QWidget:
         wrap = QGroupBox(title)
@@ -356,42 +495,61 @@ class FlashTab(QWidget):
         except Exception:
             pass
 
+    @staticmethod
+    def _char_format(color: str, bold: bool = False) -> QTextCharFormat:
+        fmt = QTextCharFormat()
+        fmt.setForeground(QColor(color))
+        if bold:
+            fmt.setFontWeight(QFont.Weight.Bold)
+        return fmt
+
+    @staticmethod
+    def _append_colored(view: QTextEdit, parts: list):
+        """以纯文本追加一段新内容，parts 为 (文本, QTextCharFormat) 列表。"""
+        bar = view.verticalScrollBar()
+        at_end = bar.value() == bar.maximum()
+        doc = view.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not doc.isEmpty():
+            cursor.insertBlock()
+        for text, fmt in parts:
+            cursor.insertText(text, fmt)
+        # 与 append() 一致：原本在底部时保持跟随
+        if at_end:
+            bar.setValue(bar.maximum())
+
     def _get_colors(self):
         return self.addr_color, self.hex_color, self.ascii_color
 
-    def _guess_base_address(self, hex_str: str) -> int | None:
+    @staticmethod
+    def _guess_base_address(hex_str: str = '', data: bytes | None = None) -> int | None:
         """尝试从帧里解析 START 后的地址 (HEX:STARTXXXXXXXX)。失败则返回 None。"""
         try:
-            data = bytes.fromhex(hex_str)
-            text = data.decode('latin1', errors='ignore')
-            key = "HEX:START"
-            idx = text.find(key)
-            if idx != -1 and len(text) >= idx + len(key) + 8:
-                addr_str = text[idx + len(key): idx + len(key) + 8]
-                if all(c in '0123456789ABCDEFabcdef' for c in addr_str):
-                    return int(addr_str, 16)
+            if data is None:
+                data = bytes.fromhex(hex_str)
+            idx = data.find(_START_KEY)
+            if idx != -1:
+                m = _HEX8_RE.match(data, idx + len(_START_KEY))
+                if m:
+                    return int(m.group(), 16)
         except Exception:
             return None
         return None
 
     def _update_column_display(self, view: QTextEdit, raw_frames: list, column_type: str):
         """显示特定列数据供用户直接选中复制，带颜色。"""
-        # 颜色定义
-        addr_color, hex_color, ascii_color = self._get_colors()
-        
+        span_pre, col = self._column_spans[column_type]
+
         lines = []
         for hex_str in raw_frames:
-            base = self._guess_base_address(hex_str)
-            dump, addr_col, hex_col, ascii_col = self._hex_dump(hex_str, base_address=base, return_parts=True)
-            if column_type == '地址列':
-                colored = f'<span style="color:{addr_color};">{addr_col}</span>'
-                lines.append(colored)
-            elif column_type == 'HEX列':
-                colored = f'<span style="color:{hex_color};">{hex_col}</span>'
-                lines.append(colored)
-            elif column_type == 'ASCII列':
-                colored = f'<span style="color:{ascii_color};">{ascii_col}</span>'
-                lines.append(colored)
+            try:
+                data = bytes.fromhex(hex_str)
+            except Exception:
+                data = None
+            base = self._guess_base_address(hex_str, data=data)
+            parts = self._hex_dump(hex_str, base_address=base, return_parts=True, data=data)
+            lines.append(span_pre + parts[col] + '</span>')
         html = '<div style="white-space: pre; font-family: monospace;">' + '<br><br>'.join(lines) + '</div>'
         view.setHtml(html)
 
@@ -496,27 +654,74 @@ class FlashTab(QWidget):
         if self.serial_worker:
             self.serial_worker.setPassthroughMode(True)
 
-        # 创建worker
+        # 创建worker，并移到独立线程，避免界面重绘拖慢重试节奏
+        self.stop_flash_thread()
         self.flash_worker = FlashWorker()
         self.flash_worker.init_retry_delay = self.spin_init_retry.value()  # 应用输入框的初始化重试延迟
         self.flash_worker.program_retry_delay = self.spin_program_retry.value()  # 应用编程重试延迟
-        # 设置日志启用回调
-        self.flash_worker.set_logging_enabled_callback(lambda: self.chk_enable_logging.isChecked())
+        # 设置日志启用回调（烧录线程中调用，只读缓存的布尔值，不访问控件）
+        self._logging_on = self.chk_enable_logging.isChecked()
+        self.flash_worker.set_logging_enabled_callback(lambda: self._logging_on)
         self.flash_worker.sigProgress.connect(self.on_progress)
         self.flash_worker.sigCompleted.connect(self.on_completed)
         self.flash_worker.sigLog.connect(self.on_log)
-        self.flash_worker.sigFrameSent.connect(self.on_frame_sent)
-        self.flash_worker.sigFrameRecv.connect(self.on_frame_recv)
+        # 帧HEX直接交给格式化线程，界面线程只接收整理好的日志条目
+        self.flash_worker.sigFrameSent.connect(self.log_formatter.format_sent)
+        self.flash_worker.sigFrameRecv.connect(self.log_formatter.format_recv)
         self.flash_worker.sigErrorDetail.connect(self.on_error_detail)
         self.flash_worker.sigVerifyOk.connect(self.on_verify_ok)
+        self.sigStartFlash.connect(self.flash_worker.start_flash)
+        self.sigFrameToFlash.connect(self.flash_worker.handle_received_frame)
+        self.sigAbortFlash.connect(self.flash_worker.abort)
+        self.sigStepFlash.connect(self.flash_worker.step_next)
+        # 串口读线程收到的帧直接投递到烧录线程，不经过界面线程
+        if self.serial_worker:
+            self.serial_worker.sigFrameRecv.connect(self.flash_worker.handle_received_hex)
+            self._direct_rx = True
+
+        self.flash_thread = QThread()
+        self.flash_worker.moveToThread(self.flash_thread)
+        self.flash_thread.start()
 
         # 启动烧录
-        self.flash_worker.start_flash(self.serial_port, self.hex_file_path, debug_mode=self.debug_mode)
+        self.sigStartFlash.emit(self.serial_port, self.hex_file_path, self.debug_mode)
+
+    def stop_flash_thread(self):
+        """断开与烧录worker的连接并结束烧录线程"""
+        worker = self.flash_worker
+        if worker is not None:
+            for sig in (self.sigStartFlash, self.sigFrameToFlash, self.sigAbortFlash, self.sigStepFlash):
+                try:
+                    sig.disconnect()
+                except (RuntimeError, TypeError):
+                    pass
+            if self._direct_rx and self.serial_worker:
+                try:
+                    self.serial_worker.sigFrameRecv.disconnect(worker.handle_received_hex)
+                except (RuntimeError, TypeError):
+                    pass
+        self._direct_rx = False
+        if self.flash_thread is not None:
+            self.flash_thread.quit()
+            self.flash_thread.wait()
+            self.flash_thread = None
+
+    def stop_log_thread(self):
+        """结束帧日志格式化线程"""
+        if self.log_thread is not None:
+            self._stop_thread(self.log_thread)
+            self.log_thread = None
+
+    @staticmethod
+    def _stop_thread(thread: QThread):
+        # 对已结束的线程重复调用是安全的
+        thread.quit()
+        thread.wait()
 
     def on_abort_clicked(self):
         """中止烧录"""
         if self.flash_worker:
-            self.flash_worker.abort()
+            self.sigAbortFlash.emit()
         self.btn_next_step.setEnabled(False)
 
     def on_progress(self, percent: int, message: str):
@@ -536,6 +741,7 @@ class FlashTab(QWidget):
         # 禁用透传模式
         if self.serial_worker:
             self.serial_worker.setPassthroughMode(False)
+        self.stop_flash_thread()
 
         if success:
             QMessageBox.information(self, "成功", message)
@@ -547,6 +753,7 @@ class FlashTab(QWidget):
     def _on_logging_changed(self, state: int):
         """日志启用状态改变"""
         enabled = self.chk_enable_logging.isChecked()
+        self._logging_on = enabled
         if enabled:
             self.status_log_view.append("[系统] 日志输出已启用")
         else:
@@ -554,125 +761,102 @@ class FlashTab(QWidget):
     
     def on_log(self, message: str):
         """状态日志消息"""
-        import time
-        timestamp = time.strftime("%H:%M:%S")
-        self.status_log_view.append(f"[{timestamp}] {message}")
+        timestamp = _timestamp()
+        # 烧录线程可能把多行日志合并为一条发出，逐行加时间戳
+        self.status_log_view.append('\n'.join(f"[{timestamp}] {line}" for line in message.split('\n')))
 
-    def on_frame_sent(self, hex_str: str):
-        """发送帧"""
+    def on_frame_sent(self, hex_str: str, timestamp: str, head: str, dump: str, rows: int):
+        """发送帧（已由格式化线程整理好）"""
         # 如果禁用日志，则不显示任何内容
         if not self.chk_enable_logging.isChecked():
             return
-            
-        import time
-        timestamp = time.strftime("%H:%M:%S")
-
-        try:
-            data_len = len(bytes.fromhex(hex_str))
-        except Exception:
-            data_len = 0
 
-        # HEX格式（分行dump + CRC展示，带颜色）
-        base = self._guess_base_address(hex_str)
-        ac, hc, asc = self._get_colors()
-        dump = self._hex_dump(hex_str, base_address=base, html_color=True, addr_color=ac, hex_color=hc, ascii_color=asc)
-        self.send_logs_hex.append(f'<span style="color:#CCC;">[{timestamp}] TX len={data_len}B</span>\n{dump}')
+        self.send_logs_hex.append((head, dump, rows))
         self.send_raw_frames.append(hex_str)
+        self.send_frame_times.append(timestamp)
+        self._send_seq += 1
 
-        # ASCII预览（不可打印替换为.，仅预览）
-        preview = self._ascii_preview(hex_str)
-        head_hex = ' '.join([hex_str[i:i+2] for i in range(0, min(len(hex_str), 64), 2)]).upper()
-        self.send_logs_ascii.append(
-            f"[{timestamp}] TX len={data_len}B\nHEX头部: {head_hex}\nASCII预览: {preview}")
+        # 更新显示（合并到下一次定时刷新）
+        self._send_dirty = True
+        if not self._log_refresh_timer.isActive():
+            self._log_refresh_timer.start()
 
-        # 更新显示
-        self._update_send_display()
-
-    def on_frame_recv(self, hex_str: str):
-        """接收帧"""
+    def on_frame_recv(self, hex_str: str, timestamp: str, head: str, dump: str, rows: int):
+        """接收帧（已由格式化线程整理好）"""
         # 如果禁用日志，则不显示任何内容
         if not self.chk_enable_logging.isChecked():
             return
-            
-        import time
-        timestamp = time.strftime("%H:%M:%S")
 
-        try:
-            data_len = len(bytes.fromhex(hex_str))
-        except Exception:
-            data_len = 0
-
-        # HEX格式（分行dump + CRC展示，带颜色）
-        base = self._guess_base_address(hex_str)
-        ac, hc, asc = self._get_colors()
-        dump = self._hex_dump(hex_str, base_address=base, html_color=True, addr_color=ac, hex_color=hc, ascii_color=asc)
-        self.recv_logs_hex.append(f'<span style="color:#CCC;">[{timestamp}] RX len={data_len}B</span>\n{dump}')
+        self.recv_logs_hex.append((head, dump, rows))
         self.recv_raw_frames.append(hex_str)
+        self.recv_frame_times.append(timestamp)
+        self._recv_seq += 1
 
-        # ASCII预览（不可打印替换为.，仅预览）
-        preview = self._ascii_preview(hex_str)
-        head_hex = ' '.join([hex_str[i:i+2] for i in range(0, min(len(hex_str), 64), 2)]).upper()
-        self.recv_logs_ascii.append(
-            f"[{timestamp}] RX len={data_len}B\nHEX头部: {head_hex}\nASCII预览: {preview}")
-
-        # 更新显示
-        self._update_recv_display()
+        # 更新显示（合并到下一次定时刷新）
+        self._recv_dirty = True
+        if not self._log_refresh_timer.isActive():
+            self._log_refresh_timer.start()
 
     def on_error_detail(self, error_type: str, expected: str, received: str):
         """详细错误信息"""
-        import time
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = _timestamp()
 
         if error_type == "CRC_MISMATCH":
-            msg = f'<span style="color: red; font-weight: bold;">[{timestamp}] CRC校验失败!</span><br>'
-            msg += f'  期望: <span style="color: blue;">{expected}</span><br>'
-            msg += f'  实际: <span style="color: red;">{received}</span>'
-            self.status_log_view.append(msg)
+            title, title_fmt, exp_label, act_label = "CRC校验失败!", self._fmt_err_title, "期望", "实际"
         elif error_type == "DATA_MISMATCH":
-            msg = f'<span style="color: orange; font-weight: bold;">[{timestamp}] 数据内容错误!</span><br>'
-            msg += f'  期望: <span style="color: blue;">{expected}</span><br>'
-            msg += f'  实际: <span style="color: red;">{received}</span>'
-            self.status_log_view.append(msg)
+            title, title_fmt, exp_label, act_label = "数据内容错误!", self._fmt_warn_title, "期望", "实际"
         elif error_type == "FORMAT_ERROR":
-            msg = f'<span style="color: red; font-weight: bold;">[{timestamp}] 格式错误!</span><br>'
-            msg += f'  期望格式: <span style="color: blue;">{expected}</span><br>'
-            msg += f'  接收内容: <span style="color: red;">{received}</span>'
-            self.status_log_view.append(msg)
+            title, title_fmt, exp_label, act_label = "格式错误!", self._fmt_err_title, "期望格式", "接收内容"
+        else:
+            return
+        self._append_colored(self.status_log_view, [
+            (f"[{timestamp}] {title}\n", title_fmt),
+            (f"  {exp_label}: ", self._fmt_plain), (expected, self._fmt_expected),
+            (f"\n  {act_label}: ", self._fmt_plain), (received, self._fmt_actual),
+        ])
 
     def on_verify_ok(self, expected: str, received: str):
         """校验成功"""
-        import time
-        timestamp = time.strftime("%H:%M:%S")
-        msg = f'<span style="color: green; font-weight: bold;">[{timestamp}] 校验成功!</span><br>'
-        msg += f'  期望: <span style="color: green;">{expected}</span><br>'
-        msg += f'  实际: <span style="color: green;">{received}</span>'
-        self.status_log_view.append(msg)
+        timestamp = _timestamp()
+        self._append_colored(self.status_log_view, [
+            (f"[{timestamp}] 校验成功!\n", self._fmt_ok_title),
+            ("  期望: ", self._fmt_plain), (expected, self._fmt_ok),
+            ("\n  实际: ", self._fmt_plain), (received, self._fmt_ok),
+        ])
 
     def on_next_step_clicked(self):
         """调试模式：手动下一步"""
         if self.flash_worker:
-            self.flash_worker.step_next()
+            self.sigStepFlash.emit()
         else:
             self.status_log_view.append("[WARN] 尚未开始烧录，无法下一步")
 
+    def _flush_frame_logs(self):
+        """定时刷新有新帧的日志视图"""
+        if self._send_dirty:
+            self._update_send_display()
+        if self._recv_dirty:
+            self._update_recv_display()
+
     def on_log_format_changed(self, format_text: str):
         """日志格式切换"""
+        self._send_rendered = 0
+        self._recv_rendered = 0
         self._update_send_display()
         self._update_recv_display()
 
     def _update_send_display(self):
         """更新发送日志显示"""
+        self._send_dirty = False
         fmt = self.log_format.currentText()
-        if fmt == '完整HEX':
-            html = '<div style="white-space: pre; font-family: monospace;">' + '<br>'.join(self.send_logs_hex) + '</div>'
-            self.send_log_view.setHtml(html)
-        elif fmt == 'ASCII预览':
+        if fmt == 'ASCII预览':
+            self._send_ascii_seq = self._sync_ascii_logs(self.send_logs_ascii, self.send_raw_frames, self.send_frame_times, 'TX',
+                                                         self._send_ascii_seq, self._send_seq)
             self.send_log_view.setPlainText('\n'.join(self.send_logs_ascii))
         elif fmt in ('地址列', 'HEX列', 'ASCII列'):
             self._update_column_display(self.send_log_view, self.send_raw_frames, fmt)
         else:
-            html = '<div style="white-space: pre; font-family: monospace;">' + '<br>'.join(self.send_logs_hex) + '</div>'
-            self.send_log_view.setHtml(html)
+            self._send_rendered = self._render_hex_logs(self.send_log_view, self.send_logs_hex, self._send_rendered, self._send_seq)
 
         # 滚动到底部
         cursor = self.send_log_view.textCursor()
@@ -681,29 +865,97 @@ class FlashTab(QWidget):
 
     def _update_recv_display(self):
         """更新接收日志显示"""
+        self._recv_dirty = False
         fmt = self.log_format.currentText()
-        if fmt == '完整HEX':
-            html = '<div style="white-space: pre; font-family: monospace;">' + '<br>'.join(self.recv_logs_hex) + '</div>'
-            self.recv_log_view.setHtml(html)
-        elif fmt == 'ASCII预览':
+        if fmt == 'ASCII预览':
+            self._recv_ascii_seq = self._sync_ascii_logs(self.recv_logs_ascii, self.recv_raw_frames, self.recv_frame_times, 'RX',
+                                                         self._recv_ascii_seq, self._recv_seq)
             self.recv_log_view.setPlainText('\n'.join(self.recv_logs_ascii))
         elif fmt in ('地址列', 'HEX列', 'ASCII列'):
             self._update_column_display(self.recv_log_view, self.recv_raw_frames, fmt)
         else:
-            html = '<div style="white-space: pre; font-family: monospace;">' + '<br>'.join(self.recv_logs_hex) + '</div>'
-            self.recv_log_view.setHtml(html)
+            self._recv_rendered = self._render_hex_logs(self.recv_log_view, self.recv_logs_hex, self._recv_rendered, self._recv_seq)
 
         # 滚动到底部
         cursor = self.recv_log_view.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
         self.recv_log_view.setTextCursor(cursor)
 
+    def _sync_ascii_logs(self, logs: deque, raw_frames: deque, times: deque, tag: str, done: int, seq: int) -> int:
+        """为序号 done 之后尚未格式化的帧补齐ASCII预览条目，返回新的已处理序号。"""
+        start = len(raw_frames) - min(seq - done, len(raw_frames))
+        for hex_str, ts in zip(islice(raw_frames, start, None), islice(times, start, None)):
+            try:
+                data = bytes.fromhex(hex_str)
+            except Exception:
+                data = None
+            if data is not None:
+                data_len = len(data)
+                head_hex = data[:32].hex(' ').upper()
+            else:
+                data_len = 0
+                head_hex = ' '.join([hex_str[j:j+2] for j in range(0, min(len(hex_str), 64), 2)]).upper()
+            # ASCII预览（不可打印替换为.，仅预览）
+            preview = self._ascii_preview(hex_str, data=data)
+            logs.append(f"[{ts}] {tag} len={data_len}B\nHEX头部: {head_hex}\nASCII预览: {preview}")
+        return seq
+
+    def _render_hex_logs(self, view: QTextEdit, logs: deque, rendered: int, seq: int) -> int:
+        """完整HEX视图：首次整体重建，之后只追加序号 rendered 之后的新条目。返回已渲染序号。"""
+        new = seq - rendered
+        if rendered == 0 or new > len(logs) or new < 0:
+            view.clear()
+            new = len(logs)
+        if new > 0:
+            doc = view.document()
+            cursor = QTextCursor(doc)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            first = doc.isEmpty()
+            for entry in islice(logs, len(logs) - new, None):
+                if first:
+                    first = False
+                else:
+                    cursor.insertBlock()
+                self._insert_hex_entry(cursor, entry)
+            cursor.endEditBlock()
+        return seq
+
+    def _insert_hex_entry(self, cursor: QTextCursor, entry: tuple):
+        """以纯文本插入一帧的HEX dump，按列设置颜色。"""
+        head, dump, rows = entry
+        cursor.insertText(head, self._fmt_head)
+        for i, line in enumerate(dump.split('\n')):
+            cursor.insertBlock()
+            if i >= rows:
+                cursor.insertText(line, self._fmt_meta)
+                continue
+            # 行格式: 地址: HEX列 |ASCII列|，HEX列只含十六进制字符和空格
+            addr_end = line.index(':')
+            bar = line.index(' |', addr_end)
+            cursor.insertText(line[:addr_end], self._fmt_addr)
+            cursor.insertText(': ', self._fmt_plain)
+            cursor.insertText(line[addr_end + 2:bar], self._fmt_hex)
+            cursor.insertText(' |', self._fmt_plain)
+            cursor.insertText(line[bar + 2:-1], self._fmt_ascii)
+            cursor.insertText('|', self._fmt_plain)
+
     def clear_all_logs(self):
         """清空所有日志"""
+        self._send_rendered = 0
+        self._recv_rendered = 0
+        self._send_seq = 0
+        self._recv_seq = 0
+        self._send_ascii_seq = 0
+        self._recv_ascii_seq = 0
         self.send_logs_ascii.clear()
         self.send_logs_hex.clear()
         self.recv_logs_ascii.clear()
         self.recv_logs_hex.clear()
+        self.send_raw_frames.clear()
+        self.recv_raw_frames.clear()
+        self.send_frame_times.clear()
+        self.recv_frame_times.clear()
         self.send_log_view.clear()
         self.recv_log_view.clear()
         self.status_log_view.clear()
@@ -719,5 +971,6 @@ class FlashTab(QWidget):
 
     def handle_received_data(self, data: bytes):
         """处理接收到的数据"""
-        if self.is_flashing and self.flash_worker:
-            self.flash_worker.handle_received_frame(data)
+        # 已由串口线程直接投递到烧录线程时不再重复转发
+        if self.is_flashing and self.flash_worker and not self._direct_rx:
+            self.sigFrameToFlash.emit(data)
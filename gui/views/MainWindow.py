@@ -156,7 +156,7 @@ class MainWindow(QMainWindow):
         recvLay = QVBoxLayout(recvWrap)
         recvCtl = QHBoxLayout()
         btnRecvClear = QPushButton('清空')
-        btnRecvClear.clicked.connect(lambda: self.recvView.clear())
+        btnRecvClear.clicked.connect(self._onRecvClear)
         recvCtl.addWidget(QLabel('显示:'))
         recvCtl.addWidget(self.recvFormat)
         recvCtl.addWidget(btnRecvClear)
@@ -194,6 +194,12 @@ class MainWindow(QMainWindow):
         self.sendAsciiBuf = []
         self.recvToggle = False
         self.sendToggle = False
+        # 接收区合并刷新：收到的片段先缓存，约一帧屏幕刷新(16ms)插入一次
+        self.recvPending = []
+        self.recvFlushTimer = QTimer(self)
+        self.recvFlushTimer.setSingleShot(True)
+        self.recvFlushTimer.setInterval(16)
+        self.recvFlushTimer.timeout.connect(self._flushRecvView)
         
         # 串口自动刷新定时器
         self.port_refresh_timer = QTimer()
@@ -233,14 +239,12 @@ class MainWindow(QMainWindow):
         self.worker.sigReadDone.connect(self._onReadDone)
         self.worker.sigWriteDone.connect(self._onWriteDone)
         self.worker.sigError.connect(self._onError)
-        self.worker.sigRawRecv.connect(self._onRawRecv)
-        self.worker.sigAsciiRecv.connect(self._onAsciiRecv)
+        self.worker.sigRxBatch.connect(self._onRxBatch)
         self.worker.sigRawSend.connect(self._onRawSend)
         self.worker.sigAsciiSend.connect(self._onAsciiSend)
         self.worker.sigReadFailed.connect(self._onReadFailed)
         self.worker.sigReplyOk.connect(self._onReplyOk)
         self.worker.sigReplyMismatch.connect(self._onReplyMismatch)
-        self.worker.sigRecvBreak.connect(self._onRecvBreak)
         self.recvFormat.currentTextChanged.connect(self._onRecvFormatChanged)
         self.sendFormat.currentTextChanged.connect(self._onSendFormatChanged)
         self.baudBox.currentTextChanged.connect(self._onBaudChange)
@@ -435,15 +439,35 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _onRxBatch(self):
+        # 一次取走接收线程积攒的全部显示片段，相邻片段合并后再显示
+        items, dropped = self.worker.takeRx()
+        pending = []
+        for item in items:
+            if item is None:
+                if pending:
+                    self._showRecv(b''.join(pending))
+                    pending.clear()
+                self._onRecvBreak()
+            else:
+                pending.append(item)
+        if pending:
+            self._showRecv(b''.join(pending))
+        if dropped:
+            self.status.showMessage(f'接收过快，已丢弃{dropped}段显示数据', 3000)
+
+    def _showRecv(self, data: bytes):
+        self._onRawRecv(data.hex())
+        self._onAsciiRecv(data.decode('latin1'))
+
     def _onRawRecv(self, hexstr: str):
-        # Format: [RX] HEX...
-        spaced = hexstr.upper() + ' '
+        # Format: [RX] HEX...（一次可能收到多个字节）
+        spaced = ' '.join([hexstr[i:i+2] for i in range(0, len(hexstr), 2)]).upper() + ' '
         bg_color = '#C1FFC1' if self.recvToggle else '#F0FFF0' # Alternating Green
         html = f'<span style="background-color:{bg_color}; color:black;">{spaced}</span>'
         self.recvHexBuf.append(html)
         if self.recvFormat.currentText() == 'HEX':
-            self.recvView.moveCursor(QTextCursor.MoveOperation.End)
-            self.recvView.insertHtml(html)
+            self._appendRecvView(html)
 
     def _onAsciiRecv(self, s: str):
         # Escape HTML special chars if needed
@@ -453,8 +477,22 @@ class MainWindow(QMainWindow):
         self.recvToggle = not self.recvToggle
         self.recvAsciiBuf.append(html)
         if self.recvFormat.currentText() == 'ASCII':
+            self._appendRecvView(html)
+
+    def _appendRecvView(self, html: str):
+        self.recvPending.append(html)
+        if not self.recvFlushTimer.isActive():
+            self.recvFlushTimer.start()
+
+    def _flushRecvView(self):
+        if self.recvPending:
             self.recvView.moveCursor(QTextCursor.MoveOperation.End)
-            self.recvView.insertHtml(html)
+            self.recvView.insertHtml(''.join(self.recvPending))
+            self.recvPending.clear()
+
+    def _onRecvClear(self):
+        self.recvPending.clear()
+        self.recvView.clear()
 
     def _onReadDone(self, data: dict):
         if data:
@@ -500,6 +538,8 @@ class MainWindow(QMainWindow):
             pass
 
     def _onRecvFormatChanged(self, text: str):
+        # 待插入的片段已在缓冲中，整体重建时一并显示
+        self.recvPending.clear()
         self.recvView.clear()
         if text == 'HEX':
             # Buffers now contain HTML fragments
@@ -534,8 +574,7 @@ class MainWindow(QMainWindow):
         html = '<br><br>'
         self.recvHexBuf.append(html)
         self.recvAsciiBuf.append(html)
-        self.recvView.moveCursor(QTextCursor.MoveOperation.End)
-        self.recvView.insertHtml(html)
+        self._appendRecvView(html)
         # Reset toggle to ensure next line starts with first color? 
         # Or keep alternating? Resetting might look cleaner for new block.
         self.recvToggle = False
@@ -559,6 +598,11 @@ class MainWindow(QMainWindow):
                 self.config_manager.set_last_baud_rate(current_baud)
             except ValueError:
                 pass
+            # 写入尚未落盘的配置
+            self.config_manager.flush()
+            # 结束烧录线程
+            self.flash_tab.stop_flash_thread()
+            self.flash_tab.stop_log_thread()
             
             self.worker.shutdown()
         except Exception:
@@ -3,6 +3,7 @@ Intel HEX 文件解析器
 支持解析标准的Intel HEX文件格式
 """
 from typing import List, Tuple, Dict
+from bisect import bisect_right
 import struct
 import os
 import sys
@@ -42,18 +43,34 @@ class HexParser:
 
     def __init__(self):
         self.records: List[HexRecord] = []
-        self.data_map: Dict[int, int] = {}  # address -> byte value
+        # 连续数据段 [(起始地址, 数据), ...]，按地址升序且互不重叠
+        self.segments: List[Tuple[int, bytearray]] = []
+        self._data_map: Dict[int, int] | None = None
         self.min_address = None
         self.max_address = None
 
+    @property
+    def data_map(self) -> Dict[int, int]:
+        """address -> byte value（按需从数据段生成，仅为兼容旧脚本保留）"""
+        if self._data_map is None:
+            data_map: Dict[int, int] = {}
+            for start, data in self.segments:
+                data_map.update(zip(range(start, start + len(data)), data))
+            self._data_map = data_map
+        return self._data_map
+
     def parse_file(self, filepath: str) -> bool:
         """解析HEX文件"""
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+                lines = f.read().splitlines()
 
             self.records = []
-            self.data_map = {}
+            self.segments = []
+            self._data_map = None
+            self.min_address = None
+            self.max_address = None
+            chunks: List[Tuple[int, bytes]] = []
             extended_address = 0
 
             for line_num, line in enumerate(lines, 1):
@@ -73,15 +90,9 @@ class HexParser:
 
                 # 处理不同类型的记录
                 if record.record_type == self.DATA_RECORD:
-                    # 数据记录
-                    for i, byte_val in enumerate(record.data):
-                        addr = record.address + i
-                        self.data_map[addr] = byte_val
-
-                        if self.min_address is None or addr < self.min_address:
-                            self.min_address = addr
-                        if self.max_address is None or addr > self.max_address:
-                            self.max_address = addr
+                    # 数据记录（整条记录处理，不再逐字节写入字典）
+                    if record.data:
+                        chunks.append((record.address, record.data))
 
                 elif record.record_type == self.EXTENDED_LINEAR_ADDRESS:
                     # 扩展线性地址
@@ -92,6 +103,7 @@ class HexParser:
                     # 文件结束
                     break
 
+            self._build_segments(chunks)
             return True
 
         except Exception as e:
@@ -105,24 +117,19 @@ class HexParser:
             # 移除空格和换行
             line = line.strip().replace(' ', '')
 
-            # 解析各字段
+            # 整条记录一次性解码: 长度(1) + 地址(2) + 类型(1) + 数据(n) + 校验和(1)
             byte_count = int(line[0:2], 16)
-            address = int(line[2:6], 16)
-            record_type = int(line[6:8], 16)
-
-            # 提取数据
-            data_start = 8
-            data_end = data_start + byte_count * 2
-            data_hex = line[data_start:data_end]
-            data = bytes.fromhex(data_hex)
+            raw = bytes.fromhex(line[:(byte_count + 5) * 2])
+            if len(raw) != byte_count + 5:
+                raise ValueError("记录长度不足")
 
-            # 校验和
-            checksum = int(line[data_end:data_end+2], 16)
+            address = (raw[1] << 8) | raw[2]
+            record_type = raw[3]
+            data = raw[4:4 + byte_count]
+            checksum = raw[4 + byte_count]
 
             # 验证校验和
-            calc_sum = byte_count + (address >> 8) + (address & 0xFF) + record_type
-            calc_sum += sum(data)
-            calc_sum = (~calc_sum + 1) & 0xFF
+            calc_sum = (-sum(raw[:4 + byte_count])) & 0xFF
 
             if calc_sum != checksum:
                 raise ValueError(f"校验和错误 (计算:{calc_sum:02X}, 实际:{checksum:02X})")
@@ -137,37 +144,58 @@ class HexParser:
                 print(f"解析行失败: {e}")
             return None
 
+    def _build_segments(self, chunks: List[Tuple[int, bytes]]):
+        """将数据记录合并为连续数据段，重叠地址以文件中靠后的记录为准"""
+        if not chunks:
+            return
+
+        # 先按地址合并出互不重叠的区间
+        spans: List[List[int]] = []
+        for start, data in sorted(chunks, key=lambda c: c[0]):
+            end = start + len(data)
+            if spans and start <= spans[-1][1]:
+                if end > spans[-1][1]:
+                    spans[-1][1] = end
+            else:
+                spans.append([start, end])
+
+        starts = [start for start, _ in spans]
+        segments = [(start, bytearray(end - start)) for start, end in spans]
+
+        # 再按文件顺序整段拷贝，保证后写入的记录覆盖先写入的
+        for start, data in chunks:
+            seg_start, buf = segments[bisect_right(starts, start) - 1]
+            offset = start - seg_start
+            buf[offset:offset + len(data)] = data
+
+        self.segments = segments
+        self.min_address = spans[0][0]
+        self.max_address = spans[-1][1] - 1
+
+    def get_image(self, fill: int = 0xFF) -> bytearray:
+        """
+        获取从 min_address 到 max_address 的连续镜像
+        地址空洞用 fill 填充
+        """
+        if not self.segments:
+            return bytearray()
+        base = self.min_address
+        image = bytearray([fill]) * (self.max_address - base + 1)
+        for start, data in self.segments:
+            offset = start - base
+            image[offset:offset + len(data)] = data
+        return image
+
     def get_data_blocks(self, block_size: int = 256) -> List[Tuple[int, bytes]]:
         """
         获取数据块列表
         返回: [(address, data_bytes), ...]
         """
-        if not self.data_map:
-            return []
-
+        # 每个连续数据段按 block_size 直接切片，块不会跨越地址空洞
         blocks = []
-        addresses = sorted(self.data_map.keys())
-
-        if not addresses:
-            return []
-
-        # 分块
-        current_start = addresses[0]
-        current_data = bytearray()
-
-        for addr in addresses:
-            # 如果地址不连续或超过块大小,创建新块
-            if (addr != current_start + len(current_data)) or (len(current_data) >= block_size):
-                if current_data:
-                    blocks.append((current_start, bytes(current_data)))
-                current_start = addr
-                current_data = bytearray()
-
-            current_data.append(self.data_map[addr])
-
-        # 添加最后一个块
-        if current_data:
-            blocks.append((current_start, bytes(current_data)))
+        for start, data in self.segments:
+            for offset in range(0, len(data), block_size):
+                blocks.append((start + offset, bytes(data[offset:offset + block_size])))
 
         return blocks
 
@@ -179,7 +207,7 @@ class HexParser:
 
     def get_data_bytes(self) -> int:
         """获取实际数据字节数"""
-        return len(self.data_map)
+        return sum(len(data) for _, data in self.segments)
 
 
 if __name__ == '__main__':